@@ -1,11 +1,23 @@
 from __future__ import annotations
 
+import asyncio
 import random
 import re
-from typing import Any, Dict, List
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Dict, List, Tuple
 
+try:
+    from datasets import load_dataset
+except Exception:  # pragma: no cover
+    load_dataset = None
 
-FALLBACK_GSM8K = [
+_NUM_RE = re.compile(r"-?\d+(?:\.\d+)?")
+# Per line: the first number (same match as _NUM_RE.search) or "" when the line has none.
+_FIRST_NUM_PER_LINE = re.compile(r"^.*?(-?\d+(?:\.\d+)?).*$|^.*$", re.MULTILINE)
+
+
+FALLBACK_GSM8K = (
     {
         "id": "gsm8k_001",
         "prompt": "If Alice has 12 apples and gives 5 to Bob, how many apples does she have left? Return only the number.",
@@ -36,40 +48,73 @@ FALLBACK_GSM8K = [
         "answer": "16",
         "max_tokens": 24,
     },
-]
+)
 
 
 
 def _normalize_numeric_answer(value: str) -> str:
     value = (value or "").strip()
     value = value.replace(",", "")
-    match = re.search(r"-?\d+(?:\.\d+)?", value)
+    match = _NUM_RE.search(value)
     return match.group(0) if match else value
 
 
 
+def _normalize_numeric_answers(values: List[str]) -> List[str]:
+    cleaned = [(value or "").strip().replace(",", "") for value in values]
+    # Single regex pass over the joined column; fall back per row if lines would not align.
+    if any("\n" in value for value in cleaned):
+        return [_normalize_numeric_answer(value) for value in values]
+    numbers = _FIRST_NUM_PER_LINE.findall("\n".join(cleaned))
+    if len(numbers) != len(cleaned):
+        return [_normalize_numeric_answer(value) for value in values]
+    return [number or value for number, value in zip(numbers, cleaned)]
+
+
+@lru_cache(maxsize=None)
+def _shuffled_fallback(seed: int) -> Tuple[Dict[str, Any], ...]:
+    data = list(FALLBACK_GSM8K)
+    random.Random(seed).shuffle(data)
+    return tuple(data)
+
+
+@lru_cache(maxsize=8)
+def _load_dataset_samples(limit: int) -> Tuple[Dict[str, Any], ...]:
+    # Raises instead of falling back, so lru_cache only keeps successful loads.
+    # Stream the split and pull only the first `limit` rows instead of materializing it.
+    dataset = load_dataset("gsm8k", "main", split="test", streaming=True)
+    rows = list(islice(dataset, limit))
+    raw_answers = [str(row.get("answer", "")).rpartition("####")[2].strip() for row in rows]
+    answers = _normalize_numeric_answers(raw_answers)
+    samples: List[Dict[str, Any]] = [
+        {
+            "id": f"gsm8k_{idx:04d}",
+            "prompt": row.get("question", "") + "\nReturn only the final numeric answer.",
+            "answer": answer,
+            "max_tokens": 24,
+        }
+        for idx, (row, answer) in enumerate(zip(rows, answers))
+    ]
+    if not samples:
+        raise ValueError("dataset returned no samples")
+    return tuple(samples)
+
+
+def _load_impl(limit: int, seed: int) -> Tuple[Dict[str, Any], ...]:
+    if load_dataset is not None:
+        try:
+            return _load_dataset_samples(limit)
+        except Exception:
+            pass
+
+    return _shuffled_fallback(seed)[:limit]
+
+
 def load_gsm8k_samples(limit: int = 50, seed: int = 42) -> List[Dict[str, Any]]:
-    try:
-        from datasets import load_dataset
-
-        dataset = load_dataset("gsm8k", "main", split=f"test[:{limit}]")
-        samples: List[Dict[str, Any]] = []
-        for idx, row in enumerate(dataset):
-            ans_raw = str(row.get("answer", "")).split("####")[-1].strip()
-            samples.append(
-                {
-                    "id": f"gsm8k_{idx:04d}",
-                    "prompt": row.get("question", "") + "\nReturn only the final numeric answer.",
-                    "answer": _normalize_numeric_answer(ans_raw),
-                    "max_tokens": 24,
-                }
-            )
-        if samples:
-            return samples
-    except Exception:
-        pass
-
-    rnd = random.Random(seed)
-    data = FALLBACK_GSM8K.copy()
-    rnd.shuffle(data)
-    return data[:limit]
+    # Samples are cached per (limit, seed); hand out copies so callers can mutate freely.
+    return [dict(sample) for sample in _load_impl(limit, seed)]
+
+
+async def load_gsm8k_samples_async(limit: int = 50, seed: int = 42) -> List[Dict[str, Any]]:
+    # Dataset fetches are blocking I/O; run them in a worker so several loaders can overlap.
+    return await asyncio.to_thread(load_gsm8k_samples, limit, seed)
@@ -1,10 +1,22 @@
 from __future__ import annotations
 
+import asyncio
 import random
-from typing import Any, Dict, List
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Dict, List, Tuple
 
+try:
+    from datasets import load_dataset
+except Exception:  # pragma: no cover
+    load_dataset = None
 
-FALLBACK_MMLU = [
+_MMLU_LETTERS = ("A", "B", "C", "D")
+_MMLU_ANSWER_LETTERS = ("a", "b", "c", "d")
+_MMLU_PROMPT_TAIL = "Answer with only the option letter."
+
+
+FALLBACK_MMLU = (
     {
         "id": "mmlu_001",
         "prompt": "What is the capital of Japan?\nA. Beijing\nB. Seoul\nC. Tokyo\nD. Bangkok\nAnswer with only the option letter.",
@@ -35,43 +47,62 @@ FALLBACK_MMLU = [
         "answer": "c",
         "max_tokens": 24,
     },
-]
+)
 
 
 def _format_mmlu_prompt(question: str, choices: List[str]) -> str:
-    letters = ["A", "B", "C", "D"]
-    lines = [question]
-    for idx, choice in enumerate(choices[:4]):
-        lines.append(f"{letters[idx]}. {choice}")
-    lines.append("Answer with only the option letter.")
-    return "\n".join(lines)
+    # zip() stops at the shorter side, so at most four options are listed.
+    options = (f"{letter}. {choice}" for letter, choice in zip(_MMLU_LETTERS, choices))
+    return "\n".join((question, *options, _MMLU_PROMPT_TAIL))
+
+
+
+@lru_cache(maxsize=None)
+def _shuffled_fallback(seed: int) -> Tuple[Dict[str, Any], ...]:
+    data = list(FALLBACK_MMLU)
+    random.Random(seed).shuffle(data)
+    return tuple(data)
+
 
+@lru_cache(maxsize=8)
+def _load_dataset_samples(limit: int) -> Tuple[Dict[str, Any], ...]:
+    # Raises instead of falling back, so lru_cache only keeps successful loads.
+    # Stream the split and pull only the first `limit` rows instead of materializing it.
+    dataset = load_dataset("cais/mmlu", "all", split="test", streaming=True)
+    rows = list(islice(dataset, limit))
+    samples: List[Dict[str, Any]] = []
+    for idx, row in enumerate(rows):
+        choices = row.get("choices", [])
+        answer_idx = int(row.get("answer", 0))
+        answer_letter = _MMLU_ANSWER_LETTERS[answer_idx] if 0 <= answer_idx <= 3 else "a"
+        samples.append(
+            {
+                "id": f"mmlu_{idx:04d}",
+                "prompt": _format_mmlu_prompt(row.get("question", ""), choices),
+                "answer": answer_letter,
+                "max_tokens": 24,
+            }
+        )
+    if not samples:
+        raise ValueError("dataset returned no samples")
+    return tuple(samples)
+
+
+def _load_impl(limit: int, seed: int) -> Tuple[Dict[str, Any], ...]:
+    if load_dataset is not None:
+        try:
+            return _load_dataset_samples(limit)
+        except Exception:
+            pass
+
+    return _shuffled_fallback(seed)[:limit]
 
 
 def load_mmlu_samples(limit: int = 50, seed: int = 42) -> List[Dict[str, Any]]:
-    try:
-        from datasets import load_dataset
-
-        dataset = load_dataset("cais/mmlu", "all", split=f"test[:{limit}]")
-        samples: List[Dict[str, Any]] = []
-        for idx, row in enumerate(dataset):
-            choices = row.get("choices", [])
-            answer_idx = int(row.get("answer", 0))
-            answer_letter = ["a", "b", "c", "d"][answer_idx] if 0 <= answer_idx <= 3 else "a"
-            samples.append(
-                {
-                    "id": f"mmlu_{idx:04d}",
-                    "prompt": _format_mmlu_prompt(row.get("question", ""), choices),
-                    "answer": answer_letter,
-                    "max_tokens": 24,
-                }
-            )
-        if samples:
-            return samples
-    except Exception:
-        pass
-
-    rnd = random.Random(seed)
-    data = FALLBACK_MMLU.copy()
-    rnd.shuffle(data)
-    return data[:limit]
+    # Samples are cached per (limit, seed); hand out copies so callers can mutate freely.
+    return [dict(sample) for sample in _load_impl(limit, seed)]
+
+
+async def load_mmlu_samples_async(limit: int = 50, seed: int = 42) -> List[Dict[str, Any]]:
+    # Dataset fetches are blocking I/O; run them in a worker so several loaders can overlap.
+    return await asyncio.to_thread(load_mmlu_samples, limit, seed)
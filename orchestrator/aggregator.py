@@ -1,14 +1,40 @@
 from __future__ import annotations
 
 import json
-from collections import Counter, defaultdict
+import os
+import threading
+from collections import Counter, defaultdict, deque
 from dataclasses import asdict, dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Deque, Dict, List, Tuple
+
+try:
+    import orjson
+except Exception:  # pragma: no cover
+    orjson = None
 
 from .utils import normalize_answer, pairwise_agreement
 
 
+@lru_cache(maxsize=256)
+def _cached_agreement(answers: Tuple[str, ...]) -> float:
+    # Keyed on the non-empty normalized answers, so strategies run over the same
+    # responses share one pairwise_agreement computation.
+    return pairwise_agreement(list(answers))
+
+
+@dataclass(slots=True)
+class AgentResponse:
+    """Typed view of the response fields read by the voting strategies."""
+
+    agent_id: str
+    normalized_answer: str
+    normalized_predicted_majority: str
+    # Raw value from the agent reply; only weighted voting parses it.
+    confidence: Any
+
+
 @dataclass
 class AggregationResult:
     strategy: str
@@ -23,26 +49,64 @@ class AggregationResult:
 
 
 class AggregationManager:
-    def __init__(self, weights_path: str, learning_rate: float = 0.2) -> None:
+    def __init__(self, weights_path: str, learning_rate: float = 0.2, flush_interval: int | None = 32) -> None:
         self.weights_path = Path(weights_path)
         self.learning_rate = learning_rate
+        # None: never write from update_weights_from_ground_truth; the owner calls flush()/write_weights().
+        self.flush_interval = None if flush_interval is None else max(1, int(flush_interval))
+        self._dirty_count = 0
+        # Bumped whenever the weights change, so callers can tell stale weight-dependent results.
+        self.weights_version = 0
+        self._write_lock = threading.Lock()
         self.weights: Dict[str, float] = {}
-        self.history: Dict[str, List[int]] = defaultdict(list)
+        self.history: Dict[str, Deque[int]] = defaultdict(lambda: deque(maxlen=512))
         self._load_weights()
 
     def _load_weights(self) -> None:
         if not self.weights_path.exists():
             return
         try:
-            data = json.loads(self.weights_path.read_text(encoding="utf-8"))
+            if orjson is not None:
+                data = orjson.loads(self.weights_path.read_bytes())
+            else:
+                data = json.loads(self.weights_path.read_text(encoding="utf-8"))
             if isinstance(data, dict):
                 self.weights = {str(k): float(v) for k, v in data.items()}
         except Exception:
             self.weights = {}
 
-    def _save_weights(self) -> None:
+    def write_weights(self, weights: Dict[str, float]) -> None:
+        # Write to a temp file, fsync, then rename over the target so readers never see a partial file.
         self.weights_path.parent.mkdir(parents=True, exist_ok=True)
-        self.weights_path.write_text(json.dumps(self.weights, indent=2), encoding="utf-8")
+        if orjson is not None:
+            data = orjson.dumps(weights, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(weights, indent=2).encode("utf-8")
+        tmp_path = self.weights_path.with_name(self.weights_path.name + ".tmp")
+        with self._write_lock:
+            with tmp_path.open("wb") as fh:
+                fh.write(data)
+                fh.flush()
+                os.fsync(fh.fileno())
+            os.replace(tmp_path, self.weights_path)
+
+    def _save_weights(self) -> None:
+        self.write_weights(self.weights)
+        self._dirty_count = 0
+
+    def take_dirty_snapshot(self) -> Dict[str, float] | None:
+        # Copy of the weights if they changed since the last write, for writing off the event loop.
+        if not self._dirty_count:
+            return None
+        self._dirty_count = 0
+        return dict(self.weights)
+
+    def mark_dirty(self) -> None:
+        self._dirty_count = max(1, self._dirty_count)
+
+    def flush(self) -> None:
+        if self._dirty_count:
+            self._save_weights()
 
     def initialize_weights(self, agents: List[Any]) -> None:
         changed = False
@@ -51,18 +115,40 @@ class AggregationManager:
                 self.weights[agent.id] = float(agent.base_weight)
                 changed = True
         if changed:
+            self.weights_version += 1
             self._save_weights()
 
-    def _ensure_answer_fields(self, responses: List[Dict[str, Any]]) -> None:
+    def _ensure_answer_fields(self, responses: List[Dict[str, Any]]) -> List[AgentResponse]:
+        records: List[AgentResponse] = []
         for resp in responses:
-            answer = normalize_answer(resp.get("answer", ""))
-            pred = normalize_answer(resp.get("predicted_majority", answer))
-            resp["normalized_answer"] = answer
-            resp["normalized_predicted_majority"] = pred or answer
+            # Already normalized by an earlier strategy on the same responses.
+            if "normalized_answer" not in resp or "normalized_predicted_majority" not in resp:
+                answer = normalize_answer(resp.get("answer", ""))
+                predicted = resp.get("predicted_majority")
+                resp["normalized_answer"] = answer
+                # Missing/empty predictions fall back to the answer without normalizing it twice.
+                resp["normalized_predicted_majority"] = (normalize_answer(predicted) if predicted else "") or answer
+            records.append(
+                AgentResponse(
+                    agent_id=resp["agent_id"],
+                    normalized_answer=resp["normalized_answer"],
+                    normalized_predicted_majority=resp["normalized_predicted_majority"],
+                    confidence=resp.get("confidence", 0.5),
+                )
+            )
+        return records
 
     def majority_vote(self, responses: List[Dict[str, Any]]) -> AggregationResult:
-        self._ensure_answer_fields(responses)
-        votes = Counter(resp["normalized_answer"] for resp in responses if resp["normalized_answer"])
+        records = self._ensure_answer_fields(responses)
+        answers: List[str] = []
+        agents_by_answer: Dict[str, List[str]] = defaultdict(list)
+        for record in records:
+            answer = record.normalized_answer
+            if answer:
+                answers.append(answer)
+                agents_by_answer[answer].append(record.agent_id)
+        # Counter over a prebuilt list takes its C counting fast path.
+        votes = Counter(answers)
         if not votes:
             return AggregationResult(
                 strategy="majority",
@@ -73,9 +159,10 @@ class AggregationManager:
                 metadata={"error": "No valid votes"},
             )
 
-        winner, _ = votes.most_common(1)[0]
-        winners = [resp["agent_id"] for resp in responses if resp["normalized_answer"] == winner]
-        agreement = pairwise_agreement([resp["normalized_answer"] for resp in responses])
+        # max() keeps the first-seen answer on ties, matching most_common(1).
+        winner = max(votes, key=votes.__getitem__)
+        winners = agents_by_answer[winner]
+        agreement = _cached_agreement(tuple(answers))
         return AggregationResult(
             strategy="majority",
             answer=winner,
@@ -86,15 +173,23 @@ class AggregationManager:
         )
 
     def weighted_vote(self, responses: List[Dict[str, Any]]) -> AggregationResult:
-        self._ensure_answer_fields(responses)
+        records = self._ensure_answer_fields(responses)
         scores: Dict[str, float] = defaultdict(float)
-        for resp in responses:
-            answer = resp["normalized_answer"]
+        answers: List[str] = []
+        winner, best_score = "", -1.0
+        for record in records:
+            answer = record.normalized_answer
             if not answer:
                 continue
-            agent_weight = self.weights.get(resp["agent_id"], 1.0)
-            confidence = float(resp.get("confidence", 0.5))
-            scores[answer] += agent_weight * max(0.0, min(confidence, 1.0))
+            answers.append(answer)
+            agent_weight = self.weights.get(record.agent_id, 1.0)
+            score = scores[answer] + agent_weight * max(0.0, min(float(record.confidence), 1.0))
+            scores[answer] = score
+            if score > best_score:
+                winner, best_score = answer, score
+            elif score == best_score and answer != winner:
+                # Exact tie: keep the answer seen first, as max() over scores would.
+                winner = next(key for key in scores if key in (answer, winner))
 
         if not scores:
             return AggregationResult(
@@ -106,26 +201,37 @@ class AggregationManager:
                 metadata={"error": "No valid weighted votes"},
             )
 
-        winner = max(scores.items(), key=lambda kv: kv[1])[0]
-        winners = [resp["agent_id"] for resp in responses if resp["normalized_answer"] == winner]
-        agreement = pairwise_agreement([resp["normalized_answer"] for resp in responses])
+        winners = [record.agent_id for record in records if record.normalized_answer == winner]
+        agreement = _cached_agreement(tuple(answers))
         return AggregationResult(
             strategy="weighted",
             answer=winner,
-            scores={k: float(v) for k, v in scores.items()},
+            scores=dict(scores),
             agreement_rate=agreement,
             winning_agents=winners,
             metadata={"weights": {aid: float(self.weights.get(aid, 1.0)) for aid in self.weights}},
         )
 
     def inverse_surprising_popularity(self, responses: List[Dict[str, Any]]) -> AggregationResult:
-        self._ensure_answer_fields(responses)
-        n = max(1, len(responses))
+        records = self._ensure_answer_fields(responses)
+        n = max(1, len(records))
 
-        actual_counts = Counter(resp["normalized_answer"] for resp in responses if resp["normalized_answer"])
-        predicted_counts = Counter(
-            resp["normalized_predicted_majority"] for resp in responses if resp["normalized_predicted_majority"]
-        )
+        answers: List[str] = []
+        predictions: List[str] = []
+        agents_by_answer: Dict[str, List[str]] = defaultdict(list)
+        second_order_hits = 0
+        for record in records:
+            answer = record.normalized_answer
+            predicted = record.normalized_predicted_majority
+            if answer:
+                answers.append(answer)
+                agents_by_answer[answer].append(record.agent_id)
+            if predicted:
+                predictions.append(predicted)
+            if answer == predicted:
+                second_order_hits += 1
+        actual_counts = Counter(answers)
+        predicted_counts = Counter(predictions)
 
         if not actual_counts:
             return AggregationResult(
@@ -138,34 +244,26 @@ class AggregationManager:
             )
 
         eps = 1e-6
-        isp_scores: Dict[str, float] = {}
-        for answer in set(actual_counts) | set(predicted_counts):
-            actual_share = actual_counts.get(answer, 0) / n
-            predicted_share = predicted_counts.get(answer, 0) / n
-            # Inverse surprising popularity: amplify answers with higher-than-expected support.
-            isp_scores[answer] = actual_share / (predicted_share + eps)
+        # Inverse surprising popularity: amplify answers with higher-than-expected support.
+        isp_scores: Dict[str, float] = {
+            answer: (actual_counts.get(answer, 0) / n) / (predicted_counts.get(answer, 0) / n + eps)
+            for answer in {**actual_counts, **predicted_counts}
+        }
 
         winner = max(isp_scores.items(), key=lambda kv: kv[1])[0]
-        winners = [resp["agent_id"] for resp in responses if resp["normalized_answer"] == winner]
-        agreement = pairwise_agreement([resp["normalized_answer"] for resp in responses])
+        winners = agents_by_answer.get(winner, [])
+        agreement = _cached_agreement(tuple(answers))
 
         return AggregationResult(
             strategy="isp",
             answer=winner,
-            scores={k: float(v) for k, v in isp_scores.items()},
+            scores=isp_scores,
             agreement_rate=agreement,
             winning_agents=winners,
             metadata={
                 "actual_share": {k: float(v / n) for k, v in actual_counts.items()},
                 "predicted_share": {k: float(v / n) for k, v in predicted_counts.items()},
-                "second_order_agreement": float(
-                    sum(
-                        1
-                        for resp in responses
-                        if resp["normalized_answer"] == resp["normalized_predicted_majority"]
-                    )
-                    / n
-                ),
+                "second_order_agreement": float(second_order_hits / n),
             },
         )
 
@@ -203,12 +301,14 @@ class AggregationManager:
             pred = normalize_answer(resp.get("answer", ""))
             correct = int(pred == truth)
             self.history[aid].append(correct)
-            if len(self.history[aid]) > 512:
-                self.history[aid] = self.history[aid][-512:]
 
             old = self.weights.get(aid, 1.0)
             updated = (1 - self.learning_rate) * old + self.learning_rate * float(correct)
             self.weights[aid] = max(min_weight, min(max_weight, updated))
+        self.weights_version += 1
 
-        self._save_weights()
+        # Persist every `flush_interval` updates; flush() writes any remainder.
+        self._dirty_count += 1
+        if self.flush_interval is not None and self._dirty_count >= self.flush_interval:
+            self._save_weights()
         return self.weights
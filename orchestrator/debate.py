@@ -42,16 +42,18 @@ class DebateEngine:
                 "metadata": {"early_stop": True},
             }
 
-        peer_summary_lines = []
+        peer_summary = "\n".join(
+            f"- {response['agent_id']} ({response['model_id']}): answer={response.get('answer','')} conf={response.get('confidence', 0.5)}"
+            for response in round1_responses
+        )
+
+        round1_by_agent: Dict[str, Dict[str, Any]] = {}
         for response in round1_responses:
-            peer_summary_lines.append(
-                f"- {response['agent_id']} ({response['model_id']}): answer={response.get('answer','')} conf={response.get('confidence', 0.5)}"
-            )
-        peer_summary = "\n".join(peer_summary_lines)
+            round1_by_agent.setdefault(response["agent_id"], response)
 
         round2_tasks = []
         for agent in agents:
-            previous = next((item for item in round1_responses if item["agent_id"] == agent.id), {})
+            previous = round1_by_agent.get(agent.id, {})
             round2_prompt = (
                 "Round 2 debate. Compare with peers and revise if needed.\n"
                 f"Original question:\n{query}\n\n"
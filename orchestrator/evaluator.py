@@ -1,23 +1,27 @@
 from __future__ import annotations
 
+import asyncio
 import csv
+import io
 import json
 import math
 import statistics
+import threading
 import time
 from collections import defaultdict
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Sequence, Tuple
 
 import httpx
 
 try:
-    import matplotlib
-
-    matplotlib.use("Agg")
-    import matplotlib.pyplot as plt
+    # Figure + Agg canvas directly: no pyplot figure registry, safe to render off the event loop.
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
 except Exception:  # pragma: no cover
-    plt = None
+    Figure = None
+    FigureCanvasAgg = None
 
 try:
     import numpy as np
@@ -29,37 +33,156 @@ try:
 except Exception:  # pragma: no cover
     stats = None
 
-from .utils import normalize_answer, token_f1
-
-
+try:
+    import orjson
+except Exception:  # pragma: no cover
+    orjson = None
 
-def _mean(values: List[float]) -> float:
-    return float(sum(values) / len(values)) if values else 0.0
+try:
+    import h2
+except Exception:  # pragma: no cover
+    h2 = None
+
+from .utils import normalize_answer, token_f1_from_tokens
+
+
+
+RECORD_FIELDS = (
+    "benchmark",
+    "repetition",
+    "strategy",
+    "sample_id",
+    "prompt",
+    "truth",
+    "prediction",
+    "correct",
+    "f1",
+    "latency_ms",
+    "agreement_rate",
+    "cpu_percent",
+    "gpu_util_percent",
+    "error",
+)
+SUMMARY_FIELDS = (
+    "benchmark",
+    "strategy",
+    "n",
+    "accuracy",
+    "f1",
+    "latency_mean_ms",
+    "latency_std_ms",
+    "agreement_rate",
+    "cpu_mean",
+    "gpu_util_mean",
+    "accuracy_ci_low",
+    "accuracy_ci_high",
+)
+SIGNIFICANCE_FIELDS = (
+    "benchmark",
+    "comparison",
+    "paired_t_p",
+    "paired_t_stat",
+    "wilcoxon_p",
+    "wilcoxon_stat",
+    "mean_delta",
+    "significant_paired_t_0.05",
+    "significant_wilcoxon_0.05",
+)
+_record_row = itemgetter(*RECORD_FIELDS)
+# (prompt, normalized truth, truth tokens, max_tokens, sample_id, raw answer)
+PreparedSample = Tuple[str, str, Tuple[str, ...], int, Any, str]
+# Read-only fallbacks for missing response fields; never mutated.
+DEFAULT_AGG: Dict[str, Any] = {"answer": "", "agreement_rate": 0.0}
+_EMPTY_MAPPING: Dict[str, Any] = {}
+_SUMMARY_METRICS = ("correct", "f1", "latency_ms", "agreement_rate", "cpu_percent", "gpu_util_percent")
+
+
+
+def _empty_metric_lists() -> Dict[str, List[float]]:
+    return {name: [] for name in _SUMMARY_METRICS}
+
+
+
+def _mean(values: Sequence[float]) -> float:
+    if not len(values):
+        return 0.0
+    if np is not None:
+        return float(np.mean(values))
+    return float(sum(values) / len(values))
 
 
 
-def _std(values: List[float]) -> float:
+def _std(values: Sequence[float]) -> float:
     if len(values) <= 1:
         return 0.0
+    if np is not None:
+        return float(np.std(values, ddof=1))
     return float(statistics.stdev(values))
 
 
 
-def confidence_interval(values: List[float], confidence: float = 0.95) -> Tuple[float, float]:
-    if not values:
-        return 0.0, 0.0
-    if len(values) == 1:
-        return values[0], values[0]
+def _gpu_util_mean(gpus: List[Dict[str, Any]]) -> float:
+    if not gpus:
+        return 0.0
+    if np is not None:
+        utils = np.fromiter(
+            (float(x.get("utilization_percent", 0.0)) for x in gpus), dtype=np.float64, count=len(gpus)
+        )
+        return float(utils.mean())
+    return _mean([float(x.get("utilization_percent", 0.0)) for x in gpus])
+
+
+
+def _correct_vector(values: List[int]) -> Any:
+    if np is None:
+        return [float(value) for value in values]
+    return np.fromiter(values, dtype=np.uint8, count=len(values))
+
+
 
-    mean = _mean(values)
-    std_err = statistics.stdev(values) / math.sqrt(len(values))
+def _as_float_vector(values: Any) -> Any:
+    if np is None:
+        return values
+    return values.astype(np.float64)
 
+
+
+def confidence_intervals_batch(
+    value_lists: Sequence[Sequence[float]],
+    confidence: float = 0.95,
+) -> List[Tuple[float, float]]:
+    intervals: List[Tuple[float, float]] = [(0.0, 0.0)] * len(value_lists)
+    pending: List[Tuple[int, float, float, int]] = []
+    for pos, values in enumerate(value_lists):
+        n = len(values)
+        if n == 0:
+            continue
+        if n == 1:
+            intervals[pos] = (values[0], values[0])
+            continue
+        if np is not None:
+            arr = np.asarray(values, dtype=np.float64)
+            mean, std = float(arr.mean()), float(arr.std(ddof=1))
+        else:
+            mean, std = _mean(values), statistics.stdev(values)
+        pending.append((pos, mean, std / math.sqrt(n), n - 1))
+
+    if not pending:
+        return intervals
     if stats is not None:
-        z = stats.t.ppf((1 + confidence) / 2.0, len(values) - 1)
+        # One t.ppf call vectorized over every degrees-of-freedom value.
+        z_values = stats.t.ppf((1 + confidence) / 2.0, [dof for _, _, _, dof in pending])
     else:
-        z = 1.96
-    margin = z * std_err
-    return mean - margin, mean + margin
+        z_values = [1.96] * len(pending)
+    for (pos, mean, std_err, _), z in zip(pending, z_values):
+        margin = float(z) * std_err
+        intervals[pos] = (mean - margin, mean + margin)
+    return intervals
+
+
+
+def confidence_interval(values: Sequence[float], confidence: float = 0.95) -> Tuple[float, float]:
+    return confidence_intervals_batch([values], confidence)[0]
 
 
 
@@ -102,12 +225,53 @@ def paired_significance(base: List[float], other: List[float]) -> Dict[str, Any]
 
 
 
-def _write_csv(path: Path, rows: List[Dict[str, Any]]) -> None:
+def paired_significance_batch(base: Sequence[float], others: Sequence[Sequence[float]]) -> List[Dict[str, Any]]:
+    aligned = [pos for pos, other in enumerate(others) if len(base) and len(other) == len(base)]
+    if np is None or not aligned:
+        return [paired_significance(list(base), list(other)) for other in others]
+
+    results: List[Dict[str, Any]] = [
+        paired_significance([], []) if pos not in aligned else {} for pos in range(len(others))
+    ]
+    base_arr = np.asarray(base, dtype=np.float64)
+    other_arr = np.asarray([others[pos] for pos in aligned], dtype=np.float64)
+    mean_deltas = (other_arr - base_arr).mean(axis=1)
+    t_stats: List[Any] = [None] * len(aligned)
+    t_ps: List[Any] = [None] * len(aligned)
+    if stats is not None:
+        try:
+            # One ttest_rel call over every comparison (rows) against the shared baseline.
+            t_stat_arr, t_p_arr = stats.ttest_rel(other_arr, np.broadcast_to(base_arr, other_arr.shape), axis=1)
+            t_stats, t_ps = [float(v) for v in t_stat_arr], [float(v) for v in t_p_arr]
+        except Exception:
+            pass
+
+    for row, pos in enumerate(aligned):
+        out: Dict[str, Any] = {
+            "paired_t_p": t_ps[row],
+            "paired_t_stat": t_stats[row],
+            "wilcoxon_p": None,
+            "wilcoxon_stat": None,
+            "mean_delta": float(mean_deltas[row]),
+        }
+        if stats is not None:
+            try:
+                w_stat, w_p = stats.wilcoxon(other_arr[row], base_arr, zero_method="pratt")
+                out["wilcoxon_p"] = float(w_p)
+                out["wilcoxon_stat"] = float(w_stat)
+            except Exception:
+                pass
+        results[pos] = out
+    return results
+
+
+
+def _write_csv(path: Path, rows: List[Dict[str, Any]], fieldnames: Sequence[str] | None = None) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     if not rows:
         path.write_text("", encoding="utf-8")
         return
-    headers = sorted({k for row in rows for k in row.keys()})
+    headers = fieldnames or sorted({k for row in rows for k in row.keys()})
     with path.open("w", newline="", encoding="utf-8") as fh:
         writer = csv.DictWriter(fh, fieldnames=headers)
         writer.writeheader()
@@ -117,36 +281,70 @@ def _write_csv(path: Path, rows: List[Dict[str, Any]]) -> None:
 
 def _write_json(path: Path, payload: Any) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        path.write_bytes(orjson.dumps(payload, option=option))
+    else:
+        path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+
+
+def _write_text(path: Path, text: str) -> None:
+    path.write_text(text, encoding="utf-8")
+
+
+
+def _json_compact(payload: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY).decode("utf-8")
+    return json.dumps(payload)
+
+
+
+PLOT_MAX_STRATEGIES = 50
+_FIG_CACHE = threading.local()
 
 
 
 def _plot_metrics(summary_rows: List[Dict[str, Any]], output_path: Path, title: str) -> None:
-    if plt is None or not summary_rows:
+    # Past PLOT_MAX_STRATEGIES the bar labels are unreadable and tick rendering dominates.
+    if Figure is None or not summary_rows or len(summary_rows) > PLOT_MAX_STRATEGIES:
         return
 
     strategies = [row["strategy"] for row in summary_rows]
     accuracy = [row["accuracy"] for row in summary_rows]
     f1 = [row["f1"] for row in summary_rows]
     latency = [row["latency_mean_ms"] for row in summary_rows]
-
-    fig, axes = plt.subplots(1, 3, figsize=(14, 4))
-    axes[0].bar(strategies, accuracy)
-    axes[0].set_title("Accuracy")
+    positions = range(len(strategies))
+
+    # Plots run in worker threads, so each thread keeps its own figure and clears it per call.
+    fig = getattr(_FIG_CACHE, "metrics", None)
+    if fig is None:
+        fig = Figure(figsize=(14, 4))
+        FigureCanvasAgg(fig)
+        fig.subplots(1, 3)
+        _FIG_CACHE.metrics = fig
+    axes = fig.axes
+    for ax in axes:
+        ax.clear()
+    for ax, values, name in zip(axes, (accuracy, f1, latency), ("Accuracy", "F1", "Latency Mean (ms)")):
+        ax.bar(positions, values)
+        ax.set_xticks(positions, strategies)
+        ax.set_title(name)
+        # clear() keeps tick params, so set the rotation explicitly on every reuse.
+        ax.tick_params(axis="x", labelrotation=45 if len(strategies) > 8 else 0)
     axes[0].set_ylim(0, 1)
-
-    axes[1].bar(strategies, f1)
-    axes[1].set_title("F1")
     axes[1].set_ylim(0, 1)
 
-    axes[2].bar(strategies, latency)
-    axes[2].set_title("Latency Mean (ms)")
-
     fig.suptitle(title)
     fig.tight_layout()
     output_path.parent.mkdir(parents=True, exist_ok=True)
     fig.savefig(output_path, dpi=180)
-    plt.close(fig)
+
+
+
+def _f(value: Any) -> float:
+    return float("nan") if value is None else value
 
 
 
@@ -160,12 +358,13 @@ def _latex_summary_table(summary_rows: List[Dict[str, Any]], caption: str, label
         "Strategy & Accuracy & F1 & Latency(ms) & Latency SD & Agreement & 95\\% CI \\\\\n"
         "\\hline\n"
     )
-    body_lines = []
+    buf = io.StringIO()
+    buf.write(header)
     for row in summary_rows:
-        ci_text = f"[{row['accuracy_ci_low']:.3f}, {row['accuracy_ci_high']:.3f}]"
-        body_lines.append(
+        buf.write(
             f"{row['strategy']} & {row['accuracy']:.3f} & {row['f1']:.3f} & "
-            f"{row['latency_mean_ms']:.1f} & {row['latency_std_ms']:.1f} & {row['agreement_rate']:.3f} & {ci_text} \\\\"
+            f"{row['latency_mean_ms']:.1f} & {row['latency_std_ms']:.1f} & {row['agreement_rate']:.3f} & "
+            f"[{row['accuracy_ci_low']:.3f}, {row['accuracy_ci_high']:.3f}] \\\\\n"
         )
     footer = (
         "\\hline\n"
@@ -174,7 +373,10 @@ def _latex_summary_table(summary_rows: List[Dict[str, Any]], caption: str, label
         f"\\label{{{label}}}\n"
         "\\end{table}\n"
     )
-    return header + "\n".join(body_lines) + "\n" + footer
+    if not summary_rows:
+        buf.write("\n")
+    buf.write(footer)
+    return buf.getvalue()
 
 
 
@@ -188,14 +390,12 @@ def _latex_significance_table(significance_rows: List[Dict[str, Any]], caption:
         "Comparison & Mean $\\Delta$ & t-stat & t-p & Wilcoxon & Wilcoxon p \\\\\n"
         "\\hline\n"
     )
-    body_lines = []
+    buf = io.StringIO()
+    buf.write(header)
     for row in significance_rows:
-        body_lines.append(
-            f"{row['comparison']} & {row['mean_delta'] if row['mean_delta'] is not None else float('nan'):.4f} & "
-            f"{row['paired_t_stat'] if row['paired_t_stat'] is not None else float('nan'):.4f} & "
-            f"{row['paired_t_p'] if row['paired_t_p'] is not None else float('nan'):.4f} & "
-            f"{row['wilcoxon_stat'] if row['wilcoxon_stat'] is not None else float('nan'):.4f} & "
-            f"{row['wilcoxon_p'] if row['wilcoxon_p'] is not None else float('nan'):.4f} \\\\"
+        buf.write(
+            f"{row['comparison']} & {_f(row['mean_delta']):.4f} & {_f(row['paired_t_stat']):.4f} & "
+            f"{_f(row['paired_t_p']):.4f} & {_f(row['wilcoxon_stat']):.4f} & {_f(row['wilcoxon_p']):.4f} \\\\\n"
         )
     footer = (
         "\\hline\n"
@@ -204,14 +404,68 @@ def _latex_significance_table(significance_rows: List[Dict[str, Any]], caption:
         f"\\label{{{label}}}\n"
         "\\end{table}\n"
     )
-    return header + "\n".join(body_lines) + "\n" + footer
+    if not significance_rows:
+        buf.write("\n")
+    buf.write(footer)
+    return buf.getvalue()
 
 
 class BenchmarkEvaluator:
-    def __init__(self, orchestrator_url: str, output_root: str, timeout_s: float = 180.0) -> None:
+    def __init__(
+        self,
+        orchestrator_url: str,
+        output_root: str,
+        timeout_s: float = 180.0,
+        concurrency: int = 1,
+        batch_size: int = 1,
+        max_concurrent_benchmarks: int = 1,
+    ) -> None:
         self.orchestrator_url = orchestrator_url.rstrip("/")
         self.output_root = Path(output_root)
         self.timeout_s = timeout_s
+        self.concurrency = max(1, int(concurrency))
+        # Direct strategies are posted to /query/batch in chunks of this many samples.
+        self.batch_size = max(1, int(batch_size))
+        self._batch_supported = True
+        self.max_concurrent_benchmarks = max(1, int(max_concurrent_benchmarks))
+        self._client: httpx.AsyncClient | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        # One pooled client for the evaluator's lifetime, so keep-alive connections
+        # (and HTTP/2 streams when h2 is installed) carry over between benchmarks.
+        if self._client is None or self._client.is_closed:
+            transport = httpx.AsyncHTTPTransport(
+                http2=h2 is not None,
+                retries=2,
+                limits=httpx.Limits(
+                    max_connections=max(128, self.concurrency),
+                    max_keepalive_connections=64,
+                ),
+            )
+            self._client = httpx.AsyncClient(timeout=self.timeout_s, transport=transport)
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "BenchmarkEvaluator":
+        self._get_client()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def run_many(self, specs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        # Each spec holds run_benchmark keyword arguments; results keep the order of `specs`.
+        semaphore = asyncio.Semaphore(self.max_concurrent_benchmarks)
+
+        async def run_one(spec: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.run_benchmark(**spec)
+
+        return list(await asyncio.gather(*(run_one(spec) for spec in specs)))
 
     async def run_benchmark(
         self,
@@ -228,192 +482,327 @@ class BenchmarkEvaluator:
         benchmark_dir = self.output_root / benchmark_name
         benchmark_dir.mkdir(parents=True, exist_ok=True)
 
-        records: List[Dict[str, Any]] = []
-        correctness_by_strategy: Dict[str, List[float]] = defaultdict(list)
+        record_count = 0
+        per_strategy: Dict[str, Dict[str, List[float]]] = defaultdict(_empty_metric_lists)
         direct_set = {"majority", "weighted", "isp", "topic"}
         direct_strategies = [strategy for strategy in strategies if strategy in direct_set]
         non_direct_strategies = [strategy for strategy in strategies if strategy not in direct_set]
 
-        async with httpx.AsyncClient(timeout=self.timeout_s) as client:
-            for rep in range(repetitions):
-                for idx, sample in enumerate(samples):
-                    sample_seed = int(seed + rep * 100000 + idx)
-                    sample_id = sample.get("id", idx)
-                    truth = normalize_answer(sample["answer"])
-                    sample_max_tokens = int(sample.get("max_tokens", 64))
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        # Per-sample fields are normalized once, not once per (repetition, strategy).
+        prepared_samples: List[PreparedSample] = []
+        for idx, sample in enumerate(samples):
+            truth = normalize_answer(sample["answer"])
+            prepared_samples.append(
+                (
+                    sample["prompt"],
+                    truth,
+                    # token_f1 normalizes again; normalize_answer is not idempotent, so keep both passes.
+                    tuple(normalize_answer(truth).split()),
+                    int(sample.get("max_tokens", 64)),
+                    sample.get("id", idx),
+                    sample["answer"],
+                )
+            )
+        base_payload = {
+            "temperature": temperature,
+            "deterministic": deterministic,
+            "max_agents": max_agents,
+            "mock_mode": mock_mode,
+            "include_agent_responses": False,
+        }
+        base_meta = {"benchmark": benchmark_name}
+        base_variables = {"temperature": temperature, "deterministic": deterministic}
+
+        def direct_payload(rep: int, idx: int, sample: PreparedSample) -> Dict[str, Any]:
+            prompt, _, _, sample_max_tokens, sample_id, answer = sample
+            sample_seed = int(seed + rep * 100000 + idx)
+            return {
+                **base_payload,
+                "prompt": prompt,
+                "strategy": direct_strategies[0],
+                "seed": sample_seed,
+                "max_tokens": sample_max_tokens,
+                "ground_truth": answer,
+                "metadata": {
+                    **base_meta,
+                    "sample_id": sample_id,
+                    "independent_variables": {
+                        **base_variables,
+                        "strategy": "direct_shared_batch",
+                        "seed": sample_seed,
+                    },
+                },
+                "compute_all_direct": True,
+            }
+
+        def direct_records(
+            rep: int,
+            idx: int,
+            sample: PreparedSample,
+            shared_data: Dict[str, Any],
+            shared_elapsed_ms: float,
+        ) -> List[Dict[str, Any]]:
+            prompt, truth, truth_tokens, _, sample_id, answer = sample
+            shared_resource = shared_data.get("resource_usage") or _EMPTY_MAPPING
+            shared_gpu_util = _gpu_util_mean(shared_resource.get("gpu") or [])
+            aggregate_map = shared_data.get("aggregates")
+            if not isinstance(aggregate_map, dict):
+                aggregate_map = _EMPTY_MAPPING
+            shared_cpu = shared_resource.get("cpu_percent")
+            shared_error = shared_data.get("error")
+
+            records: List[Dict[str, Any]] = []
+            for strategy in direct_strategies:
+                aggregate_data = aggregate_map.get(strategy)
+                if aggregate_data is None and strategy == direct_strategies[0]:
+                    aggregate_data = shared_data.get("aggregate")
+                if not isinstance(aggregate_data, dict):
+                    aggregate_data = DEFAULT_AGG
+
+                pred = normalize_answer(aggregate_data.get("answer", ""))
+                correct = 1.0 if truth and pred == truth else 0.0
+                f1 = token_f1_from_tokens(pred, truth_tokens)
+                records.append(
+                    {
+                        "benchmark": benchmark_name,
+                        "repetition": rep,
+                        "strategy": strategy,
+                        "sample_id": sample_id,
+                        "prompt": prompt,
+                        "truth": answer,
+                        "prediction": pred,
+                        "correct": correct,
+                        "f1": f1,
+                        "latency_ms": shared_elapsed_ms,
+                        "agreement_rate": float(aggregate_data.get("agreement_rate", 0.0)),
+                        "cpu_percent": shared_cpu,
+                        "gpu_util_percent": shared_gpu_util,
+                        "error": shared_error,
+                    }
+                )
+            return records
+
+        async def run_direct(client: httpx.AsyncClient, rep: int, idx: int, sample: PreparedSample) -> List[Dict[str, Any]]:
+            shared_payload = direct_payload(rep, idx, sample)
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    response = await client.post(f"{self.orchestrator_url}/query", json=shared_payload)
+                    response.raise_for_status()
+                    shared_data = response.json()
+                except Exception as exc:
+                    shared_data = {
+                        "aggregate": DEFAULT_AGG,
+                        "aggregates": _EMPTY_MAPPING,
+                        "total_latency_ms": (time.perf_counter() - started) * 1000.0,
+                        "resource_usage": _EMPTY_MAPPING,
+                        "error": str(exc),
+                    }
 
-                    if direct_strategies:
-                        shared_payload = {
-                            "prompt": sample["prompt"],
-                            "strategy": direct_strategies[0],
-                            "temperature": temperature,
-                            "deterministic": deterministic,
-                            "seed": sample_seed,
-                            "max_tokens": sample_max_tokens,
-                            "max_agents": max_agents,
-                            "ground_truth": sample["answer"],
-                            "metadata": {
-                                "benchmark": benchmark_name,
-                                "sample_id": sample_id,
-                                "independent_variables": {
-                                    "strategy": "direct_shared_batch",
-                                    "temperature": temperature,
-                                    "deterministic": deterministic,
-                                    "seed": sample_seed,
-                                },
-                            },
-                            "mock_mode": mock_mode,
-                            "compute_all_direct": True,
+                reported_ms = shared_data.get("total_latency_ms")
+                if reported_ms is not None:
+                    shared_elapsed_ms = float(reported_ms)
+                else:
+                    shared_elapsed_ms = (time.perf_counter() - started) * 1000.0
+            return direct_records(rep, idx, sample, shared_data, shared_elapsed_ms)
+
+        async def run_direct_batch(
+            client: httpx.AsyncClient,
+            rep: int,
+            chunk: List[Tuple[int, PreparedSample]],
+        ) -> List[Dict[str, Any]]:
+            if not self._batch_supported:
+                return [record for idx, sample in chunk for record in await run_direct(client, rep, idx, sample)]
+
+            payload = {"queries": [direct_payload(rep, idx, sample) for idx, sample in chunk]}
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    # The server answers the batch's queries one after another; give each its own read budget.
+                    response = await client.post(
+                        f"{self.orchestrator_url}/query/batch",
+                        json=payload,
+                        timeout=self.timeout_s * len(chunk),
+                    )
+                    if response.status_code in (404, 405):
+                        results = None
+                    else:
+                        response.raise_for_status()
+                        results = response.json().get("results", [])
+                        if len(results) != len(chunk):
+                            raise ValueError(f"Expected {len(chunk)} batch results, got {len(results)}")
+                except Exception as exc:
+                    elapsed_ms = (time.perf_counter() - started) * 1000.0
+                    results = [
+                        {
+                            "aggregate": DEFAULT_AGG,
+                            "aggregates": _EMPTY_MAPPING,
+                            "total_latency_ms": elapsed_ms,
+                            "resource_usage": _EMPTY_MAPPING,
+                            "error": str(exc),
                         }
+                    ] * len(chunk)
+                batch_elapsed_ms = (time.perf_counter() - started) * 1000.0
+
+            if results is None:
+                # Orchestrator predates /query/batch; fall back to one request per sample.
+                self._batch_supported = False
+                return [record for idx, sample in chunk for record in await run_direct(client, rep, idx, sample)]
+
+            records: List[Dict[str, Any]] = []
+            for (idx, sample), shared_data in zip(chunk, results):
+                shared_elapsed_ms = float(shared_data.get("total_latency_ms", batch_elapsed_ms / len(chunk)))
+                records.extend(direct_records(rep, idx, sample, shared_data, shared_elapsed_ms))
+            return records
+
+        async def run_strategy(
+            client: httpx.AsyncClient,
+            rep: int,
+            idx: int,
+            sample: PreparedSample,
+            strategy: str,
+        ) -> List[Dict[str, Any]]:
+            prompt, truth, truth_tokens, sample_max_tokens, sample_id, answer = sample
+            sample_seed = int(seed + rep * 100000 + idx)
+
+            strategy_max_tokens = sample_max_tokens
+            strategy_max_agents = max_agents
+            if strategy == "debate":
+                strategy_max_tokens = min(sample_max_tokens, 16)
+                if strategy_max_agents is None:
+                    strategy_max_agents = 2
+
+            payload = {
+                **base_payload,
+                "prompt": prompt,
+                "strategy": strategy,
+                "seed": sample_seed,
+                "max_tokens": strategy_max_tokens,
+                "max_agents": strategy_max_agents,
+                "ground_truth": answer,
+                "metadata": {
+                    **base_meta,
+                    "sample_id": sample_id,
+                    "independent_variables": {**base_variables, "strategy": strategy, "seed": sample_seed},
+                },
+            }
+
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    response = await client.post(f"{self.orchestrator_url}/query", json=payload)
+                    response.raise_for_status()
+                    data = response.json()
+                except Exception as exc:
+                    data = {
+                        "aggregate": DEFAULT_AGG,
+                        "total_latency_ms": (time.perf_counter() - started) * 1000.0,
+                        "resource_usage": _EMPTY_MAPPING,
+                        "error": str(exc),
+                    }
 
-                        started = time.perf_counter()
-                        try:
-                            response = await client.post(f"{self.orchestrator_url}/query", json=shared_payload)
-                            response.raise_for_status()
-                            shared_data = response.json()
-                        except Exception as exc:
-                            shared_data = {
-                                "aggregate": {"answer": "", "agreement_rate": 0.0},
-                                "aggregates": {},
-                                "total_latency_ms": (time.perf_counter() - started) * 1000.0,
-                                "resource_usage": {},
-                                "error": str(exc),
-                            }
-
-                        shared_elapsed_ms = float(
-                            shared_data.get("total_latency_ms", (time.perf_counter() - started) * 1000.0)
-                        )
-                        shared_resource = shared_data.get("resource_usage", {})
-                        shared_gpu = shared_resource.get("gpu", []) or []
-                        shared_gpu_util = (
-                            _mean([float(x.get("utilization_percent", 0.0)) for x in shared_gpu]) if shared_gpu else 0.0
-                        )
-                        aggregate_map = shared_data.get("aggregates", {})
-                        if not isinstance(aggregate_map, dict):
-                            aggregate_map = {}
-
-                        for strategy in direct_strategies:
-                            aggregate_data = aggregate_map.get(strategy)
-                            if aggregate_data is None and strategy == shared_payload["strategy"]:
-                                aggregate_data = shared_data.get("aggregate", {})
-                            if not isinstance(aggregate_data, dict):
-                                aggregate_data = {"answer": "", "agreement_rate": 0.0}
-
-                            pred = normalize_answer(aggregate_data.get("answer", ""))
-                            correct = 1.0 if pred == truth and truth else 0.0
-                            f1 = token_f1(pred, truth)
-                            record = {
-                                "benchmark": benchmark_name,
-                                "repetition": rep,
-                                "strategy": strategy,
-                                "sample_id": sample_id,
-                                "prompt": sample["prompt"],
-                                "truth": sample["answer"],
-                                "prediction": pred,
-                                "correct": correct,
-                                "f1": f1,
-                                "latency_ms": shared_elapsed_ms,
-                                "agreement_rate": float(aggregate_data.get("agreement_rate", 0.0)),
-                                "cpu_percent": shared_resource.get("cpu_percent"),
-                                "gpu_util_percent": shared_gpu_util,
-                                "error": shared_data.get("error"),
-                            }
-                            records.append(record)
-                            correctness_by_strategy[strategy].append(correct)
-
-                    for strategy in non_direct_strategies:
-                        strategy_max_tokens = sample_max_tokens
-                        strategy_max_agents = max_agents
-                        if strategy == "debate":
-                            strategy_max_tokens = min(sample_max_tokens, 16)
-                            if strategy_max_agents is None:
-                                strategy_max_agents = 2
-
-                        payload = {
-                            "prompt": sample["prompt"],
-                            "strategy": strategy,
-                            "temperature": temperature,
-                            "deterministic": deterministic,
-                            "seed": sample_seed,
-                            "max_tokens": strategy_max_tokens,
-                            "max_agents": strategy_max_agents,
-                            "ground_truth": sample["answer"],
-                            "metadata": {
-                                "benchmark": benchmark_name,
-                                "sample_id": sample_id,
-                                "independent_variables": {
-                                    "strategy": strategy,
-                                    "temperature": temperature,
-                                    "deterministic": deterministic,
-                                    "seed": sample_seed,
-                                },
-                            },
-                            "mock_mode": mock_mode,
-                        }
+                reported_ms = data.get("total_latency_ms")
+                if reported_ms is not None:
+                    elapsed_ms = float(reported_ms)
+                else:
+                    elapsed_ms = (time.perf_counter() - started) * 1000.0
+            agg = data.get("aggregate") or DEFAULT_AGG
+            pred = normalize_answer(agg.get("answer", ""))
+            correct = 1.0 if truth and pred == truth else 0.0
+            f1 = token_f1_from_tokens(pred, truth_tokens)
 
-                        started = time.perf_counter()
-                        try:
-                            response = await client.post(f"{self.orchestrator_url}/query", json=payload)
-                            response.raise_for_status()
-                            data = response.json()
-                        except Exception as exc:
-                            data = {
-                                "aggregate": {"answer": "", "agreement_rate": 0.0},
-                                "total_latency_ms": (time.perf_counter() - started) * 1000.0,
-                                "resource_usage": {},
-                                "error": str(exc),
-                            }
-
-                        elapsed_ms = float(data.get("total_latency_ms", (time.perf_counter() - started) * 1000.0))
-                        pred = normalize_answer(data.get("aggregate", {}).get("answer", ""))
-                        correct = 1.0 if pred == truth and truth else 0.0
-                        f1 = token_f1(pred, truth)
-
-                        resource = data.get("resource_usage", {})
-                        gpu = resource.get("gpu", []) or []
-                        gpu_util = _mean([float(x.get("utilization_percent", 0.0)) for x in gpu]) if gpu else 0.0
-
-                        record = {
-                            "benchmark": benchmark_name,
-                            "repetition": rep,
-                            "strategy": strategy,
-                            "sample_id": sample_id,
-                            "prompt": sample["prompt"],
-                            "truth": sample["answer"],
-                            "prediction": pred,
-                            "correct": correct,
-                            "f1": f1,
-                            "latency_ms": elapsed_ms,
-                            "agreement_rate": float(data.get("aggregate", {}).get("agreement_rate", 0.0)),
-                            "cpu_percent": resource.get("cpu_percent"),
-                            "gpu_util_percent": gpu_util,
-                            "error": data.get("error"),
-                        }
-                        records.append(record)
-                        correctness_by_strategy[strategy].append(correct)
+            resource = data.get("resource_usage") or _EMPTY_MAPPING
+            gpu_util = _gpu_util_mean(resource.get("gpu") or [])
 
+            return [
+                {
+                    "benchmark": benchmark_name,
+                    "repetition": rep,
+                    "strategy": strategy,
+                    "sample_id": sample_id,
+                    "prompt": prompt,
+                    "truth": answer,
+                    "prediction": pred,
+                    "correct": correct,
+                    "f1": f1,
+                    "latency_ms": elapsed_ms,
+                    "agreement_rate": float(agg.get("agreement_rate", 0.0)),
+                    "cpu_percent": resource.get("cpu_percent"),
+                    "gpu_util_percent": gpu_util,
+                    "error": data.get("error"),
+                }
+            ]
+
+        # Raw records are streamed to disk as they land; only per-strategy metrics stay in memory.
+        with (benchmark_dir / "raw_records.csv").open("w", newline="", encoding="utf-8") as csv_fh, (
+            benchmark_dir / "raw_records.json"
+        ).open("w", encoding="utf-8") as json_fh:
+            writer = csv.writer(csv_fh)
+            writer.writerow(RECORD_FIELDS)
+            client = self._get_client()
+            # Requests run concurrently (bounded by the semaphore); awaiting the tasks in
+            # submission order keeps records in a deterministic order.
+            tasks = []
+            indexed_samples = list(enumerate(prepared_samples))
+            for rep in range(repetitions):
+                for start in range(0, len(indexed_samples), self.batch_size):
+                    chunk = indexed_samples[start : start + self.batch_size]
+                    if direct_strategies:
+                        if len(chunk) > 1:
+                            tasks.append(asyncio.ensure_future(run_direct_batch(client, rep, chunk)))
+                        else:
+                            tasks.append(asyncio.ensure_future(run_direct(client, rep, *chunk[0])))
+                    for idx, sample in chunk:
+                        for strategy in non_direct_strategies:
+                            tasks.append(asyncio.ensure_future(run_strategy(client, rep, idx, sample, strategy)))
+            # raw_records.json stays a JSON array, written one record per line as records arrive.
+            json_fh.write("[")
+            try:
+                for task in tasks:
+                    for record in await task:
+                        writer.writerow(_record_row(record))
+                        json_fh.write(("\n" if record_count == 0 else ",\n") + _json_compact(record))
+                        record_count += 1
+                        metrics = per_strategy[record["strategy"]]
+                        metrics["correct"].append(1 if record["correct"] else 0)
+                        metrics["f1"].append(record["f1"])
+                        metrics["latency_ms"].append(record["latency_ms"])
+                        metrics["agreement_rate"].append(record["agreement_rate"])
+                        metrics["cpu_percent"].append(float(record["cpu_percent"] or 0.0))
+                        metrics["gpu_util_percent"].append(float(record["gpu_util_percent"] or 0.0))
+            finally:
+                for task in tasks:
+                    task.cancel()
+            json_fh.write("\n]\n" if record_count else "]\n")
+
+        strategy_metrics = [per_strategy.get(strategy) or _empty_metric_lists() for strategy in strategies]
+        # Correctness is kept as 0/1 bytes; float64 copies are only made for the statistical tests.
+        correct_vectors = {
+            strategy: _correct_vector(metrics["correct"]) for strategy, metrics in zip(strategies, strategy_metrics)
+        }
+        correct_floats = {strategy: _as_float_vector(vector) for strategy, vector in correct_vectors.items()}
+        intervals = confidence_intervals_batch([correct_floats[strategy] for strategy in strategies])
         summary_rows: List[Dict[str, Any]] = []
-        for strategy in strategies:
-            subset = [row for row in records if row["strategy"] == strategy]
-            acc_values = [row["correct"] for row in subset]
-            f1_values = [row["f1"] for row in subset]
-            latency_values = [row["latency_ms"] for row in subset]
-            agreement_values = [row["agreement_rate"] for row in subset]
-            cpu_values = [float(row["cpu_percent"] or 0.0) for row in subset]
-            gpu_values = [float(row["gpu_util_percent"] or 0.0) for row in subset]
-            ci_low, ci_high = confidence_interval(acc_values)
+        for strategy, metrics, (ci_low, ci_high) in zip(strategies, strategy_metrics, intervals):
+            if np is not None:
+                metrics = {
+                    name: np.asarray(values, dtype=np.float64) for name, values in metrics.items() if name != "correct"
+                }
+            correct = correct_vectors[strategy]
             summary_rows.append(
                 {
                     "benchmark": benchmark_name,
                     "strategy": strategy,
-                    "n": len(subset),
-                    "accuracy": _mean(acc_values),
-                    "f1": _mean(f1_values),
-                    "latency_mean_ms": _mean(latency_values),
-                    "latency_std_ms": _std(latency_values),
-                    "agreement_rate": _mean(agreement_values),
-                    "cpu_mean": _mean(cpu_values),
-                    "gpu_util_mean": _mean(gpu_values),
+                    "n": len(correct),
+                    "accuracy": _mean(correct),
+                    "f1": _mean(metrics["f1"]),
+                    "latency_mean_ms": _mean(metrics["latency_ms"]),
+                    "latency_std_ms": _std(metrics["latency_ms"]),
+                    "agreement_rate": _mean(metrics["agreement_rate"]),
+                    "cpu_mean": _mean(metrics["cpu_percent"]),
+                    "gpu_util_mean": _mean(metrics["gpu_util_percent"]),
                     "accuracy_ci_low": ci_low,
                     "accuracy_ci_high": ci_high,
                 }
@@ -422,11 +811,12 @@ class BenchmarkEvaluator:
         baseline = strategies[0] if strategies else None
         significance_rows: List[Dict[str, Any]] = []
         if baseline:
-            base_vals = correctness_by_strategy.get(baseline, [])
-            for strategy in strategies:
-                if strategy == baseline:
-                    continue
-                test = paired_significance(base_vals, correctness_by_strategy.get(strategy, []))
+            compared = [strategy for strategy in strategies if strategy != baseline]
+            tests = paired_significance_batch(
+                correct_floats[baseline],
+                [correct_floats[strategy] for strategy in compared],
+            )
+            for strategy, test in zip(compared, tests):
                 significance_rows.append(
                     {
                         "benchmark": benchmark_name,
@@ -441,15 +831,6 @@ class BenchmarkEvaluator:
                     }
                 )
 
-        _write_csv(benchmark_dir / "raw_records.csv", records)
-        _write_json(benchmark_dir / "raw_records.json", records)
-        _write_csv(benchmark_dir / "summary.csv", summary_rows)
-        _write_json(benchmark_dir / "summary.json", summary_rows)
-        _write_csv(benchmark_dir / "significance.csv", significance_rows)
-        _write_json(benchmark_dir / "significance.json", significance_rows)
-
-        _plot_metrics(summary_rows, benchmark_dir / "metrics.png", f"{benchmark_name} benchmark")
-
         latex_summary = _latex_summary_table(
             summary_rows,
             caption=f"{benchmark_name} results for ensemble strategies",
@@ -460,14 +841,23 @@ class BenchmarkEvaluator:
             caption=f"{benchmark_name} paired significance tests",
             label=f"tab:{benchmark_name}_significance",
         )
-        (benchmark_dir / "summary_table.tex").write_text(latex_summary, encoding="utf-8")
-        (benchmark_dir / "significance_table.tex").write_text(latex_significance, encoding="utf-8")
+        # Report files and the chart are blocking I/O; write them from worker threads so
+        # other benchmarks' requests keep flowing on the event loop.
+        await asyncio.gather(
+            asyncio.to_thread(_write_csv, benchmark_dir / "summary.csv", summary_rows, SUMMARY_FIELDS),
+            asyncio.to_thread(_write_json, benchmark_dir / "summary.json", summary_rows),
+            asyncio.to_thread(_write_csv, benchmark_dir / "significance.csv", significance_rows, SIGNIFICANCE_FIELDS),
+            asyncio.to_thread(_write_json, benchmark_dir / "significance.json", significance_rows),
+            asyncio.to_thread(_write_text, benchmark_dir / "summary_table.tex", latex_summary),
+            asyncio.to_thread(_write_text, benchmark_dir / "significance_table.tex", latex_significance),
+            asyncio.to_thread(_plot_metrics, summary_rows, benchmark_dir / "metrics.png", f"{benchmark_name} benchmark"),
+        )
 
         return {
             "benchmark": benchmark_name,
             "summary": summary_rows,
             "significance": significance_rows,
-            "records": len(records),
+            "records": record_count,
             "output_dir": str(benchmark_dir),
         }
 
@@ -479,25 +869,26 @@ def save_overall_reports(
     all_significance_rows: List[Dict[str, Any]],
 ) -> None:
     out = Path(output_root)
-    _write_csv(out / "overall_summary.csv", all_summary_rows)
+    _write_csv(out / "overall_summary.csv", all_summary_rows, SUMMARY_FIELDS)
     _write_json(out / "overall_summary.json", all_summary_rows)
-    _write_csv(out / "overall_significance.csv", all_significance_rows)
+    _write_csv(out / "overall_significance.csv", all_significance_rows, SIGNIFICANCE_FIELDS)
     _write_json(out / "overall_significance.json", all_significance_rows)
 
-    if plt is not None and all_summary_rows:
+    if Figure is not None and all_summary_rows:
         by_strategy: Dict[str, List[float]] = defaultdict(list)
         for row in all_summary_rows:
             by_strategy[row["strategy"]].append(row["accuracy"])
 
         strategies = sorted(by_strategy)
         avg_accuracy = [_mean(by_strategy[s]) for s in strategies]
-        fig, ax = plt.subplots(figsize=(8, 4))
+        fig = Figure(figsize=(8, 4))
+        FigureCanvasAgg(fig)
+        ax = fig.subplots()
         ax.bar(strategies, avg_accuracy)
         ax.set_ylim(0, 1)
         ax.set_title("Average Accuracy Across Benchmarks")
         fig.tight_layout()
         fig.savefig(out / "overall_accuracy.png", dpi=180)
-        plt.close(fig)
 
     latex = _latex_summary_table(
         all_summary_rows,
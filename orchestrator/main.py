@@ -1,19 +1,33 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import json
 import os
-import random
+import statistics
 import time
 import uuid
+from collections import Counter, OrderedDict, deque
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Awaitable, BinaryIO, Deque, Dict, List, Literal, Optional
 
 import httpx
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from pydantic import BaseModel, Field
 
+try:
+    import h2
+except Exception:  # pragma: no cover
+    h2 = None
+
+try:
+    import orjson
+except Exception:  # pragma: no cover
+    orjson = None
+
 from .aggregator import AggregationManager
 from .debate import DebateEngine
 from .router import TopicRouter
@@ -21,14 +35,19 @@ from .utils import (
     AgentConfig,
     append_jsonl,
     approx_token_count,
+    deterministic_floats,
+    ensure_parent,
     extract_answer,
     get_resource_usage,
+    init_nvml,
+    jsonl_line,
     load_agent_config,
     normalize_answer,
     now_utc_iso,
     parse_confidence,
     safe_json_parse,
     set_global_seed,
+    shutdown_nvml,
     stable_choice,
 )
 
@@ -36,6 +55,29 @@ BASE_DIR = Path(__file__).resolve().parents[1]
 AGENT_CONFIG_PATH = Path(os.getenv("AGENT_CONFIG", BASE_DIR / "agents" / "agent_config.yaml"))
 LOG_PATH = Path(os.getenv("QUERY_LOG_PATH", BASE_DIR / "logs" / "query_metrics.jsonl"))
 WEIGHTS_PATH = Path(os.getenv("WEIGHTS_PATH", BASE_DIR / "logs" / "agent_weights.json"))
+LOG_BUFFER_BYTES = 64 * 1024
+LOG_FLUSH_EVERY = 64
+# Ollama itself speaks HTTP/1.1; enable only when agents sit behind an HTTP/2 proxy.
+ORCH_HTTP2 = os.getenv("ORCH_HTTP2", "0").lower() in ("1", "true", "yes")
+USAGE_REFRESH_S = float(os.getenv("ORCH_USAGE_REFRESH_S", 1.0))
+EARLY_QUORUM_ERROR = "cancelled_early_quorum"
+EARLY_QUORUM_MIN_SAMPLES = 16
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("ORCH_RESPONSE_CACHE_SIZE", 1024))
+WEIGHTS_FLUSH_S = float(os.getenv("ORCH_WEIGHTS_FLUSH_S", 1.0))
+HEALTH_PROBE_CONCURRENCY = int(os.getenv("ORCH_HEALTH_CONCURRENCY", 32))
+# Opt-in: stream completions so generation can also be cut off client-side (ORCH_STREAM=1).
+STREAM_RESPONSES = os.getenv("ORCH_STREAM", "0").lower() not in ("0", "false", "no")
+STOP_SEQUENCES = ("\n\n", "\nExplanation:", "Explanation:")
+_MAX_STOP_LEN = max(map(len, STOP_SEQUENCES))
+
+
+@lru_cache(maxsize=1024)
+def _agent_prompt(query: str) -> str:
+    return (
+        "You are one model in a distributed local ensemble. "
+        "Return only the final answer, very short, with no explanation.\n\n"
+        f"Question:\n{query}"
+    )
 
 
 class QueryRequest(BaseModel):
@@ -51,6 +93,13 @@ class QueryRequest(BaseModel):
     metadata: Dict[str, Any] = Field(default_factory=dict)
     mock_mode: bool = False
     compute_all_direct: bool = False
+    include_agent_responses: bool = True
+    early_quorum: bool = False
+    cache_mode: Literal["on", "read", "write", "off"] = "off"
+
+
+class BatchQueryRequest(BaseModel):
+    queries: List[QueryRequest] = Field(default_factory=list)
 
 
 class FeedbackRequest(BaseModel):
@@ -63,65 +112,228 @@ class OrchestratorService:
         self.config_path = config_path
         self.global_cfg: Dict[str, Any] = {}
         self.agents: List[AgentConfig] = []
-        self.router = TopicRouter.default()
+        self.router = TopicRouter.default(
+            routing_mode=os.getenv("ORCH_ROUTING_MODE", "hybrid"),
+            prefix_len=int(os.getenv("ORCH_ROUTING_PREFIX_LEN", 64)),
+        )
         self.aggregator = AggregationManager(
             weights_path=str(WEIGHTS_PATH),
             learning_rate=float(os.getenv("WEIGHT_LEARNING_RATE", 0.2)),
+            flush_interval=None,
         )
         self.debate_engine = DebateEngine(self.aggregator)
         self.request_timeout_s = 180.0
+        self._client: httpx.AsyncClient | None = None
+        self._log_queue: asyncio.Queue[Dict[str, Any]] | None = None
+        self._log_task: asyncio.Task[None] | None = None
+        self._log_fh: BinaryIO | None = None
+        self._nvml_handles: List[Any] | None = None
+        self._last_usage: Dict[str, Any] | None = None
+        self._usage_task: asyncio.Task[None] | None = None
+        self._weights_task: asyncio.Task[None] | None = None
+        self._weights_write: asyncio.Future[None] | None = None
+        self._latency_window: Deque[float] = deque(maxlen=256)
+        self._cache: OrderedDict[bytes, Dict[str, Any]] = OrderedDict()
         self.reload_agents()
 
     def reload_agents(self) -> None:
         self.global_cfg, self.agents = load_agent_config(self.config_path)
+        self.router.index_agents(self.agents)
         self.request_timeout_s = float(self.global_cfg.get("request_timeout_s", 180))
         self.aggregator.learning_rate = float(self.global_cfg.get("weight_learning_rate", 0.2))
         self.aggregator.initialize_weights(self.agents)
+        # Cache keys only cover agent ids; a reload may change the model or endpoint behind one.
+        self._cache.clear()
+
+    def _http_client(self) -> httpx.AsyncClient:
+        # Shared keep-alive pool for all agent calls; created at startup, or lazily if used before it.
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.request_timeout_s,
+                http2=ORCH_HTTP2 and h2 is not None,
+                limits=httpx.Limits(
+                    max_connections=int(os.getenv("ORCH_MAX_CONNECTIONS", 256)),
+                    max_keepalive_connections=int(os.getenv("ORCH_MAX_KEEPALIVE", 64)),
+                    keepalive_expiry=float(os.getenv("ORCH_KEEPALIVE_EXPIRY", 60.0)),
+                ),
+            )
+        return self._client
+
+    async def start(self) -> None:
+        self._http_client()
+        if self._log_task is None:
+            ensure_parent(LOG_PATH)
+            self._log_fh = LOG_PATH.open("ab", buffering=LOG_BUFFER_BYTES)
+            self._log_queue = asyncio.Queue()
+            self._log_task = asyncio.create_task(self._drain_logs())
+        if self._usage_task is None:
+            self._nvml_handles = await asyncio.to_thread(init_nvml)
+            self._last_usage = await asyncio.to_thread(get_resource_usage, self._nvml_handles)
+            self._usage_task = asyncio.create_task(self._refresh_usage())
+        if self._weights_task is None:
+            self._weights_task = asyncio.create_task(self._flush_weights())
+
+    async def close(self) -> None:
+        if self._weights_task is not None:
+            self._weights_task.cancel()
+            self._weights_task = None
+        if self._weights_write is not None:
+            # Let an in-flight snapshot land first, so the final flush() is always the last write.
+            try:
+                await self._weights_write
+            except Exception:
+                self.aggregator.mark_dirty()
+            self._weights_write = None
+        if self._usage_task is not None:
+            self._usage_task.cancel()
+            self._usage_task, self._last_usage = None, None
+        if self._nvml_handles is not None:
+            shutdown_nvml()
+            self._nvml_handles = None
+        if self._log_task is not None and self._log_queue is not None:
+            await self._log_queue.join()
+            self._log_task.cancel()
+            self._log_task, self._log_queue = None, None
+        if self._log_fh is not None:
+            self._log_fh.close()
+            self._log_fh = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _flush_weights(self) -> None:
+        # Weight updates only mark the aggregator dirty; at most one atomic write per interval.
+        while True:
+            await asyncio.sleep(WEIGHTS_FLUSH_S)
+            weights = self.aggregator.take_dirty_snapshot()
+            if weights is None:
+                continue
+            # Kept as a future and shielded, so close() can wait for a write already in progress.
+            self._weights_write = asyncio.ensure_future(asyncio.to_thread(self.aggregator.write_weights, weights))
+            try:
+                await asyncio.shield(self._weights_write)
+            except Exception:
+                self.aggregator.mark_dirty()
+
+    async def _refresh_usage(self) -> None:
+        # Resource snapshots are taken here, off the request path; run_query reads the latest one.
+        while True:
+            await asyncio.sleep(USAGE_REFRESH_S)
+            try:
+                self._last_usage = await asyncio.to_thread(get_resource_usage, self._nvml_handles)
+            except Exception:
+                pass
+
+    async def _drain_logs(self) -> None:
+        assert self._log_queue is not None
+        unflushed = 0
+        while True:
+            payload = await self._log_queue.get()
+            unflushed += 1
+            # Flush once the backlog is drained (or every LOG_FLUSH_EVERY lines under load).
+            flush = self._log_queue.empty() or unflushed >= LOG_FLUSH_EVERY
+            try:
+                await asyncio.to_thread(self._write_log, payload, flush)
+            except Exception:
+                pass
+            finally:
+                if flush:
+                    unflushed = 0
+                self._log_queue.task_done()
+
+    def _write_log(self, payload: Dict[str, Any], flush: bool) -> None:
+        if self._log_fh is None:
+            append_jsonl(LOG_PATH, payload)
+            return
+        self._log_fh.write(jsonl_line(payload))
+        if flush:
+            self._log_fh.flush()
+
+    def _log_query(self, payload: Dict[str, Any]) -> None:
+        # Log writes happen off the request path once the background writer is running.
+        if self._log_queue is not None:
+            self._log_queue.put_nowait(payload)
+        else:
+            append_jsonl(LOG_PATH, payload)
 
     @property
     def enabled_agents(self) -> List[AgentConfig]:
         return [agent for agent in self.agents if agent.enabled]
 
     def _build_prompt(self, query: str) -> str:
-        return (
-            "You are one model in a distributed local ensemble. "
-            "Return only the final answer, very short, with no explanation.\n\n"
-            f"Question:\n{query}"
-        )
+        return _agent_prompt(query)
 
-    async def _query_real_agent(
-        self,
-        client: httpx.AsyncClient,
-        agent: AgentConfig,
-        prompt: str,
-        temperature: float,
-        seed: int,
-        max_tokens: int,
-    ) -> Dict[str, Any]:
-        url = f"http://{agent.host}:{agent.port}/api/generate"
-        payload = {
-            "model": agent.model,
+    def _generate_request(self, prompt: str, temperature: float, seed: int, max_tokens: int) -> Dict[str, Any]:
+        # Shared by every agent in a fan-out; _query_real_agent only adds the model name.
+        return {
             "prompt": self._build_prompt(prompt),
-            "stream": False,
+            "stream": STREAM_RESPONSES,
             "options": {
                 "temperature": temperature,
                 "seed": int(seed),
                 "num_predict": int(max_tokens),
-                "stop": ["\n\n", "\nExplanation:", "Explanation:"],
+                "stop": list(STOP_SEQUENCES),
             },
         }
 
+    @staticmethod
+    async def _stream_generate(
+        client: httpx.AsyncClient,
+        url: str,
+        payload: Dict[str, Any],
+        timeout_s: float,
+    ) -> Dict[str, Any]:
+        # Accumulates NDJSON chunks; on a stop sequence the stream is closed early, which
+        # cancels generation upstream. Returns the same fields as a non-streaming reply.
+        text = ""
+        final: Dict[str, Any] = {}
+        async with client.stream("POST", url, json=payload, timeout=timeout_s) as resp:
+            resp.raise_for_status()
+            async for line in resp.aiter_lines():
+                if not line:
+                    continue
+                chunk = orjson.loads(line) if orjson is not None else json.loads(line)
+                if chunk.get("error"):
+                    raise RuntimeError(str(chunk["error"]))
+                piece = chunk.get("response", "")
+                if piece:
+                    scan_from = max(0, len(text) - _MAX_STOP_LEN + 1)
+                    text += piece
+                    cuts = [idx for idx in (text.find(stop, scan_from) for stop in STOP_SEQUENCES) if idx >= 0]
+                    if cuts:
+                        text = text[: min(cuts)]
+                        final = {"model": chunk.get("model")} if chunk.get("model") else {}
+                        break
+                if chunk.get("done"):
+                    final = chunk
+                    break
+        return {**final, "response": text}
+
+    async def _query_real_agent(
+        self,
+        client: httpx.AsyncClient,
+        agent: AgentConfig,
+        request: Dict[str, Any],
+        timeout_s: float | None = None,
+    ) -> Dict[str, Any]:
+        payload = {"model": agent.model, **request}
+
         started = time.perf_counter()
         try:
-            resp = await client.post(url, json=payload, timeout=self.request_timeout_s)
-            resp.raise_for_status()
-            data = resp.json()
+            if payload.get("stream"):
+                data = await self._stream_generate(client, agent.url, payload, timeout_s or self.request_timeout_s)
+            else:
+                resp = await client.post(agent.url, json=payload, timeout=timeout_s or self.request_timeout_s)
+                resp.raise_for_status()
+                data = resp.json()
             raw_response = data.get("response", "")
             parsed = safe_json_parse(raw_response) or {}
             answer = extract_answer(raw_response, parsed)
             predicted_majority = parsed.get("predicted_majority", answer)
             confidence = parse_confidence(parsed.get("confidence", 0.55 if answer else 0.0))
             token_count = int(data.get("eval_count") or approx_token_count(raw_response))
+            latency_ms = round((time.perf_counter() - started) * 1000.0, 3)
+            self._latency_window.append(latency_ms)
 
             return {
                 "agent_id": agent.id,
@@ -130,12 +342,15 @@ class OrchestratorService:
                 "answer": answer,
                 "predicted_majority": predicted_majority,
                 "confidence": confidence,
-                "latency_ms": round((time.perf_counter() - started) * 1000.0, 3),
+                "latency_ms": latency_ms,
                 "token_count": token_count,
                 "error": None,
             }
         except Exception as exc:
             err_text = str(exc).strip() or exc.__class__.__name__
+            latency_ms = round((time.perf_counter() - started) * 1000.0, 3)
+            # Timed-out and failed calls count too, so slow agents keep the soft-timeout median honest.
+            self._latency_window.append(latency_ms)
             return {
                 "agent_id": agent.id,
                 "model_id": agent.model,
@@ -143,7 +358,7 @@ class OrchestratorService:
                 "answer": "",
                 "predicted_majority": "",
                 "confidence": 0.0,
-                "latency_ms": round((time.perf_counter() - started) * 1000.0, 3),
+                "latency_ms": latency_ms,
                 "token_count": 0,
                 "error": err_text,
             }
@@ -155,7 +370,7 @@ class OrchestratorService:
         seed: int,
         stage: str,
     ) -> Dict[str, Any]:
-        rnd = random.Random(f"{seed}-{agent.id}-{stage}-{prompt}")
+        r1, r2, r3 = deterministic_floats(f"{seed}-{agent.id}-{stage}-{prompt}", 3)
         lowered = prompt.lower()
 
         if "2+2" in lowered or "2 + 2" in lowered:
@@ -170,12 +385,12 @@ class OrchestratorService:
                 f"{seed}-{agent.id}-{prompt}-{stage}",
             )
 
-        predicted_majority = answer if rnd.random() > 0.25 else stable_choice(
+        predicted_majority = answer if r1 > 0.25 else stable_choice(
             ["true", "false", "42", "paris", "b", "a", "c", "d"],
             f"{seed}-{agent.id}-pred-{prompt}",
         )
-        confidence = round(0.45 + (rnd.random() * 0.5), 3)
-        latency_ms = round(60 + rnd.random() * 220, 3)
+        confidence = round(0.45 + (r2 * 0.5), 3)
+        latency_ms = round(60 + r3 * 220, 3)
 
         raw_response = json.dumps(
             {
@@ -211,7 +426,9 @@ class OrchestratorService:
             return await self._query_mock_agent(agent, prompt, seed, stage)
         if client is None:
             raise RuntimeError("HTTP client missing for non-mock execution")
-        return await self._query_real_agent(client, agent, prompt, temperature, seed, max_tokens)
+        return await self._query_real_agent(
+            client, agent, self._generate_request(prompt, temperature, seed, max_tokens)
+        )
 
     async def collect_agent_responses(
         self,
@@ -222,6 +439,7 @@ class OrchestratorService:
         max_tokens: int,
         mock_mode: bool,
         stage: str = "direct",
+        early_quorum: bool = False,
     ) -> List[Dict[str, Any]]:
         if not agents:
             return []
@@ -231,14 +449,165 @@ class OrchestratorService:
                 self._query_agent(agent, prompt, temperature, seed, max_tokens, stage, True, None)
                 for agent in agents
             ]
-            return await asyncio.gather(*tasks)
+        else:
+            client = self._http_client()
+            request = self._generate_request(prompt, temperature, seed, max_tokens)
+            tasks = [self._query_real_agent(client, agent, request) for agent in agents]
+        if early_quorum and len(agents) > 2:
+            return await self._gather_until_quorum(agents, tasks)
+        return await asyncio.gather(*tasks)
+
+    def _soft_timeout_s(self) -> float | None:
+        if len(self._latency_window) < EARLY_QUORUM_MIN_SAMPLES:
+            return None
+        return min(self.request_timeout_s, 2.0 * statistics.median(self._latency_window) / 1000.0)
+
+    async def _gather_until_quorum(
+        self,
+        agents: List[AgentConfig],
+        coros: List[Awaitable[Dict[str, Any]]],
+    ) -> List[Dict[str, Any]]:
+        tasks = [asyncio.ensure_future(coro) for coro in coros]
+        results: List[Optional[Dict[str, Any]]] = [None] * len(tasks)
+        index = {task: idx for idx, task in enumerate(tasks)}
+        quorum = len(tasks) // 2 + 1
+        votes: Counter[str] = Counter()
+        pending = set(tasks)
+        started = time.perf_counter()
+        soft_timeout = self._soft_timeout_s()
+        deadline = None if soft_timeout is None else started + soft_timeout
+
+        while pending:
+            timeout = None if deadline is None else max(0.0, deadline - time.perf_counter())
+            done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                response = task.result()
+                results[index[task]] = response
+                answer = normalize_answer(response.get("answer", ""))
+                if answer:
+                    votes[answer] += 1
+            if not pending:
+                break
+
+            ranked = votes.most_common(2)
+            lead = ranked[0][1] - (ranked[1][1] if len(ranked) > 1 else 0) if ranked else 0
+            # Stop once the plurality answer cannot be overtaken by the agents still running,
+            # or once past the soft timeout with a quorum of responses in hand.
+            if lead > len(pending):
+                break
+            if not done and len(tasks) - len(pending) >= quorum:
+                break
+            if not done:
+                deadline = None
+
+        for task in pending:
+            task.cancel()
+        if pending:
+            # Cancelled agents took at least this long; without a sample the median (and soft timeout) would only shrink.
+            elapsed_ms = round((time.perf_counter() - started) * 1000.0, 3)
+            self._latency_window.extend([elapsed_ms] * len(pending))
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        return [
+            response if response is not None else self._early_quorum_placeholder(agent)
+            for agent, response in zip(agents, results)
+        ]
 
-        async with httpx.AsyncClient(timeout=self.request_timeout_s) as client:
-            tasks = [
-                self._query_agent(agent, prompt, temperature, seed, max_tokens, stage, False, client)
-                for agent in agents
-            ]
-            return await asyncio.gather(*tasks)
+    @staticmethod
+    def _early_quorum_placeholder(agent: AgentConfig) -> Dict[str, Any]:
+        # Same shape as a failed agent call, so aggregation and logging need no special case.
+        return {
+            "agent_id": agent.id,
+            "model_id": agent.model,
+            "response": "",
+            "answer": "",
+            "predicted_majority": "",
+            "confidence": 0.0,
+            "latency_ms": 0.0,
+            "token_count": 0,
+            "error": EARLY_QUORUM_ERROR,
+        }
+
+    def _aggregate_all_direct(
+        self,
+        responses: List[Dict[str, Any]],
+        topic_responses: List[Dict[str, Any]],
+        topic: str,
+    ) -> Dict[str, Any]:
+        # Voting is pure Python; running it inline avoids GIL-bound threads sharing the response dicts.
+        jobs = [
+            ("majority", responses),
+            ("weighted", responses),
+            ("isp", responses),
+            ("topic", topic_responses),
+        ]
+        return {
+            strategy: self.aggregator.aggregate(strategy=strategy, responses=items, topic=topic).to_dict()
+            for strategy, items in jobs
+        }
+
+    def _cache_key(self, req: QueryRequest, agents: List[AgentConfig]) -> bytes:
+        # weights_version: weighted/isp/topic answers depend on the current weights, not just the inputs.
+        parts = (
+            req.prompt,
+            req.strategy,
+            str(req.seed),
+            repr(req.temperature),
+            str(req.max_tokens),
+            str(req.mock_mode),
+            str(req.compute_all_direct),
+            str(req.early_quorum),
+            str(self.aggregator.weights_version),
+            ",".join(sorted(agent.id for agent in agents)),
+        )
+        return hashlib.blake2b("\x1f".join(parts).encode("utf-8"), digest_size=16).digest()
+
+    def _cached_result(self, cached: Dict[str, Any], req: QueryRequest, started: float) -> Dict[str, Any]:
+        result = {
+            **cached,
+            "query_id": str(uuid.uuid4()),
+            "timestamp": now_utc_iso(),
+            "requested_agent_ids": [agent_id for agent_id in req.agent_ids if agent_id],
+            "weights": self.aggregator.weights,
+            "total_latency_ms": round((time.perf_counter() - started) * 1000.0, 3),
+            "metadata": req.metadata,
+            "cache_hit": True,
+        }
+        log_payload = self._query_log_payload(req, result, cached["agent_responses"])
+        log_payload["cache_hit"] = True
+        self._log_query(log_payload)
+        if not req.include_agent_responses:
+            result.pop("agent_responses", None)
+        return result
+
+    @staticmethod
+    def _query_log_payload(
+        req: QueryRequest,
+        result: Dict[str, Any],
+        agent_responses: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        aggregate = result["aggregate"]
+        return {
+            "timestamp": result["timestamp"],
+            "query_id": result["query_id"],
+            "independent_variables": {
+                "strategy": req.strategy,
+                "temperature": req.temperature,
+                "deterministic": req.deterministic,
+                "seed": req.seed,
+                "max_agents": req.max_agents,
+                "agent_ids": result["requested_agent_ids"],
+                "mock_mode": req.mock_mode,
+            },
+            "dependent_variables": {
+                "aggregate_answer": aggregate.get("answer", ""),
+                "agreement_rate": aggregate.get("agreement_rate", 0.0),
+                "total_latency_ms": result["total_latency_ms"],
+                "resource_usage": result["resource_usage"],
+            },
+            "ground_truth": req.ground_truth,
+            "agent_responses": agent_responses,
+        }
 
     async def run_query(self, req: QueryRequest) -> Dict[str, Any]:
         started = time.perf_counter()
@@ -254,7 +623,9 @@ class OrchestratorService:
 
         topic = "general"
         if req.strategy == "topic" and not req.compute_all_direct:
-            topic, selected_agents = self.router.route(req.prompt, selected_agents, req.max_agents)
+            topic, selected_agents = self.router.route(
+                req.prompt, selected_agents if requested_agent_ids else None, req.max_agents
+            )
         elif req.max_agents:
             selected_agents = selected_agents[: req.max_agents]
 
@@ -262,6 +633,15 @@ class OrchestratorService:
             detail = "No selected agents are enabled/reachable" if requested_agent_ids else "No enabled agents available"
             raise HTTPException(status_code=400, detail=detail)
 
+        # Only deterministic, feedback-free queries are cacheable; ground truth updates weights.
+        cache_key = None
+        if req.cache_mode != "off" and req.deterministic and not req.ground_truth:
+            cache_key = self._cache_key(req, selected_agents)
+            cached = self._cache.get(cache_key) if req.cache_mode in ("on", "read") else None
+            if cached is not None:
+                self._cache.move_to_end(cache_key)
+                return self._cached_result(cached, req, started)
+
         debate_trace = None
         all_aggregates: Optional[Dict[str, Any]] = None
         if req.strategy == "debate":
@@ -286,33 +666,32 @@ class OrchestratorService:
                 )
             else:
                 debate_timeout_s = min(self.request_timeout_s, 75.0)
-                async with httpx.AsyncClient(timeout=debate_timeout_s) as debate_client:
-                    async def debate_query_fn(
-                        agent: AgentConfig,
-                        prompt: str,
-                        temperature: float,
-                        seed: int,
-                        max_tokens: int,
-                        stage: str,
-                    ) -> Dict[str, Any]:
-                        return await self._query_real_agent(
-                            debate_client,
-                            agent,
-                            prompt,
-                            temperature,
-                            seed,
-                            max_tokens,
-                        )
-
-                    debate_trace = await self.debate_engine.run(
-                        query=req.prompt,
-                        agents=selected_agents,
-                        query_fn=debate_query_fn,
-                        temperature=req.temperature,
-                        seed=req.seed,
-                        max_tokens=req.max_tokens,
+                debate_client = self._http_client()
+
+                async def debate_query_fn(
+                    agent: AgentConfig,
+                    prompt: str,
+                    temperature: float,
+                    seed: int,
+                    max_tokens: int,
+                    stage: str,
+                ) -> Dict[str, Any]:
+                    return await self._query_real_agent(
+                        debate_client,
+                        agent,
+                        self._generate_request(prompt, temperature, seed, max_tokens),
+                        timeout_s=debate_timeout_s,
                     )
 
+                debate_trace = await self.debate_engine.run(
+                    query=req.prompt,
+                    agents=selected_agents,
+                    query_fn=debate_query_fn,
+                    temperature=req.temperature,
+                    seed=req.seed,
+                    max_tokens=req.max_tokens,
+                )
+
             round2_responses = debate_trace.get("round2") or []
             if round2_responses:
                 agent_responses = round2_responses
@@ -327,28 +706,18 @@ class OrchestratorService:
                 seed=req.seed,
                 max_tokens=req.max_tokens,
                 mock_mode=req.mock_mode,
+                early_quorum=req.early_quorum,
             )
             if req.compute_all_direct:
-                all_aggregates = {}
-                for strategy_name in ("majority", "weighted", "isp"):
-                    all_aggregates[strategy_name] = self.aggregator.aggregate(
-                        strategy=strategy_name,
-                        responses=agent_responses,
-                        topic=topic,
-                    ).to_dict()
-
-                topic, topic_agents = self.router.route(req.prompt, selected_agents, None)
+                all_enabled = not requested_agent_ids and not req.max_agents
+                topic, topic_agents = self.router.route(req.prompt, None if all_enabled else selected_agents, None)
                 topic_agent_ids = {agent.id for agent in topic_agents}
                 topic_responses = [
                     response for response in agent_responses if response.get("agent_id") in topic_agent_ids
                 ]
                 if not topic_responses:
                     topic_responses = agent_responses
-                all_aggregates["topic"] = self.aggregator.aggregate(
-                    strategy="topic",
-                    responses=topic_responses,
-                    topic=topic,
-                ).to_dict()
+                all_aggregates = self._aggregate_all_direct(agent_responses, topic_responses, topic)
                 aggregate = all_aggregates.get(req.strategy, all_aggregates["majority"])
             else:
                 aggregate = self.aggregator.aggregate(
@@ -358,11 +727,13 @@ class OrchestratorService:
                 ).to_dict()
 
         if req.ground_truth:
-            self.aggregator.update_weights_from_ground_truth(agent_responses, req.ground_truth)
+            # Agents cut off by the early quorum did not answer; don't count them as wrong.
+            feedback = [response for response in agent_responses if response.get("error") != EARLY_QUORUM_ERROR]
+            self.aggregator.update_weights_from_ground_truth(feedback, req.ground_truth)
 
         total_latency_ms = round((time.perf_counter() - started) * 1000.0, 3)
         query_id = str(uuid.uuid4())
-        resource_usage = get_resource_usage()
+        resource_usage = self._last_usage if self._last_usage is not None else get_resource_usage()
 
         result = {
             "query_id": query_id,
@@ -372,7 +743,6 @@ class OrchestratorService:
             "requested_agent_ids": requested_agent_ids,
             "selected_agent_ids": [agent.id for agent in selected_agents],
             "aggregate": aggregate,
-            "agent_responses": agent_responses,
             "weights": self.aggregator.weights,
             "total_latency_ms": total_latency_ms,
             "resource_usage": resource_usage,
@@ -383,67 +753,75 @@ class OrchestratorService:
             result["aggregates"] = all_aggregates
         if debate_trace is not None:
             result["debate"] = debate_trace
-
-        log_payload = {
-            "timestamp": result["timestamp"],
-            "query_id": query_id,
-            "independent_variables": {
-                "strategy": req.strategy,
-                "temperature": req.temperature,
-                "deterministic": req.deterministic,
-                "seed": req.seed,
-                "max_agents": req.max_agents,
-                "agent_ids": requested_agent_ids,
-                "mock_mode": req.mock_mode,
-            },
-            "dependent_variables": {
-                "aggregate_answer": aggregate.get("answer", ""),
-                "agreement_rate": aggregate.get("agreement_rate", 0.0),
-                "total_latency_ms": total_latency_ms,
-                "resource_usage": resource_usage,
-            },
-            "ground_truth": req.ground_truth,
-            "agent_responses": agent_responses,
-        }
-        append_jsonl(LOG_PATH, log_payload)
+        if cache_key is not None and req.cache_mode in ("on", "write"):
+            self._cache[cache_key] = {**result, "agent_responses": agent_responses}
+            self._cache.move_to_end(cache_key)
+            while len(self._cache) > RESPONSE_CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
+        # Always logged below; clients that only need the aggregate can skip it in the response.
+        if req.include_agent_responses:
+            result["agent_responses"] = agent_responses
+
+        self._log_query(self._query_log_payload(req, result, agent_responses))
         return result
 
+    async def run_batch(self, req: BatchQueryRequest) -> Dict[str, Any]:
+        # Queries run in order so ground-truth weight updates match one-by-one submission.
+        results: List[Dict[str, Any]] = []
+        for item in req.queries:
+            try:
+                results.append(await self.run_query(item))
+            except Exception as exc:
+                # One failing query must not take the rest of the batch down with it.
+                results.append(
+                    {
+                        "aggregate": {"answer": "", "agreement_rate": 0.0},
+                        "aggregates": {},
+                        "metadata": item.metadata,
+                        "error": str(exc.detail) if isinstance(exc, HTTPException) else str(exc),
+                    }
+                )
+        return {"results": results}
+
+    async def _probe_agent(
+        self,
+        client: httpx.AsyncClient,
+        agent: AgentConfig,
+        semaphore: asyncio.Semaphore,
+    ) -> Dict[str, Any]:
+        if agent.host == "mock":
+            return {
+                "agent_id": agent.id,
+                "model": agent.model,
+                "endpoint": f"http://{agent.host}:{agent.port}",
+                "healthy": True,
+            }
+        endpoint = agent.health_url
+        async with semaphore:
+            try:
+                response = await asyncio.wait_for(client.get(endpoint, timeout=5.0), timeout=5.0)
+                response.raise_for_status()
+                return {
+                    "agent_id": agent.id,
+                    "model": agent.model,
+                    "endpoint": endpoint,
+                    "healthy": True,
+                }
+            except Exception as exc:
+                return {
+                    "agent_id": agent.id,
+                    "model": agent.model,
+                    "endpoint": endpoint,
+                    "healthy": False,
+                    "error": str(exc),
+                }
+
     async def health(self) -> Dict[str, Any]:
-        statuses: List[Dict[str, Any]] = []
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            for agent in self.enabled_agents:
-                if agent.host == "mock":
-                    statuses.append(
-                        {
-                            "agent_id": agent.id,
-                            "model": agent.model,
-                            "endpoint": f"http://{agent.host}:{agent.port}",
-                            "healthy": True,
-                        }
-                    )
-                    continue
-                endpoint = f"http://{agent.host}:{agent.port}/api/tags"
-                try:
-                    response = await client.get(endpoint)
-                    response.raise_for_status()
-                    statuses.append(
-                        {
-                            "agent_id": agent.id,
-                            "model": agent.model,
-                            "endpoint": endpoint,
-                            "healthy": True,
-                        }
-                    )
-                except Exception as exc:
-                    statuses.append(
-                        {
-                            "agent_id": agent.id,
-                            "model": agent.model,
-                            "endpoint": endpoint,
-                            "healthy": False,
-                            "error": str(exc),
-                        }
-                    )
+        client = self._http_client()
+        semaphore = asyncio.Semaphore(HEALTH_PROBE_CONCURRENCY)
+        statuses: List[Dict[str, Any]] = await asyncio.gather(
+            *(self._probe_agent(client, agent, semaphore) for agent in self.enabled_agents)
+        )
 
         all_healthy = all(item["healthy"] for item in statuses) if statuses else False
         return {
@@ -455,7 +833,11 @@ class OrchestratorService:
 
 
 service = OrchestratorService(AGENT_CONFIG_PATH)
-app = FastAPI(title="Distributed AI Orchestrator", version="1.0.0")
+app = FastAPI(
+    title="Distributed AI Orchestrator",
+    version="1.0.0",
+    default_response_class=ORJSONResponse if orjson is not None else JSONResponse,
+)
 
 
 def _cors_origins() -> List[str]:
@@ -481,6 +863,17 @@ app.add_middleware(
 )
 
 
+@app.on_event("startup")
+async def startup() -> None:
+    await service.start()
+
+
+@app.on_event("shutdown")
+async def shutdown() -> None:
+    await service.close()
+    service.aggregator.flush()
+
+
 @app.get("/")
 async def root() -> Dict[str, Any]:
     return {
@@ -526,3 +919,8 @@ async def reload_agents() -> Dict[str, Any]:
 @app.post("/query")
 async def query(req: QueryRequest) -> Dict[str, Any]:
     return await service.run_query(req)
+
+
+@app.post("/query/batch")
+async def query_batch(req: BatchQueryRequest) -> Dict[str, Any]:
+    return await service.run_batch(req)
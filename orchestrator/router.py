@@ -1,7 +1,19 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, List, Tuple
+import hashlib
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Literal, Set, Tuple
+
+try:
+    import ahocorasick
+except Exception:  # pragma: no cover
+    ahocorasick = None
+
+try:
+    import xxhash
+except Exception:  # pragma: no cover
+    xxhash = None
 
 from .utils import AgentConfig
 
@@ -9,10 +21,67 @@ from .utils import AgentConfig
 @dataclass
 class TopicRouter:
     topic_keywords: Dict[str, List[str]]
+    routing_mode: Literal["weight", "hash", "hybrid"] = "hybrid"
+    prefix_len: int = 64
+    _keyword_topics: Dict[str, List[str]] = field(init=False, repr=False, compare=False)
+    _automaton: object = field(init=False, repr=False, compare=False)
+    _keyword_re: "re.Pattern[str]" = field(init=False, repr=False, compare=False)
+    _prefix_keywords: Dict[str, Set[str]] = field(init=False, repr=False, compare=False)
+    _enabled_sorted: List[AgentConfig] = field(init=False, repr=False, compare=False)
+    _by_topic: Dict[str, List[AgentConfig]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.routing_mode not in ("weight", "hash", "hybrid"):
+            raise ValueError(f"Unsupported routing mode: {self.routing_mode}")
+        self.prefix_len = max(20, min(64, int(self.prefix_len)))
+        self._enabled_sorted, self._by_topic = [], {}
+        self._keyword_topics = {}
+        for topic, keys in self.topic_keywords.items():
+            for key in keys:
+                self._keyword_topics.setdefault(key, []).append(topic)
+        keywords = sorted(self._keyword_topics, key=len, reverse=True)
+
+        self._automaton = None
+        if ahocorasick is not None and keywords:
+            automaton = ahocorasick.Automaton()
+            for key in keywords:
+                automaton.add_word(key, key)
+            automaton.make_automaton()
+            self._automaton = automaton
+
+        # Fallback: a lookahead at every position reports the longest keyword starting there;
+        # keywords that are prefixes of it also occur at that position.
+        pattern = "|".join(map(re.escape, keywords)) if keywords else "(?!)"
+        self._keyword_re = re.compile(f"(?=({pattern}))")
+        self._prefix_keywords = {key: {other for other in keywords if key.startswith(other)} for key in keywords}
+
+    def _matched_keywords(self, text: str) -> Set[str]:
+        if self._automaton is not None:
+            return {key for _, key in self._automaton.iter(text)}
+        matched: Set[str] = set()
+        for key in self._keyword_re.findall(text):
+            matched |= self._prefix_keywords[key]
+        return matched
+
+    def index_agents(self, agents: List[AgentConfig]) -> None:
+        # Precomputed weight-sorted candidate lists, used by route() when called without agents.
+        self._enabled_sorted = sorted((a for a in agents if a.enabled), key=lambda a: a.base_weight, reverse=True)
+        self._by_topic = {
+            topic: [a for a in self._enabled_sorted if topic in a.topic_set or "general" in a.topic_set]
+            for topic in self.topic_keywords
+        }
+
+    def _prefix_hash(self, query: str) -> int:
+        prefix = query[: self.prefix_len].lower().encode("utf-8")
+        if xxhash is not None:
+            return xxhash.xxh64(prefix).intdigest()
+        return int.from_bytes(hashlib.blake2b(prefix, digest_size=8).digest(), "big")
 
     @classmethod
-    def default(cls) -> "TopicRouter":
+    def default(cls, routing_mode: str = "hybrid", prefix_len: int = 64) -> "TopicRouter":
         return cls(
+            routing_mode=routing_mode,
+            prefix_len=prefix_len,
             topic_keywords={
                 "math": ["math", "algebra", "equation", "calculate", "number", "proof", "gsm8k"],
                 "factual": ["who", "when", "where", "capital", "history", "fact", "truthful", "truthfulqa"],
@@ -23,13 +92,11 @@ class TopicRouter:
         )
 
     def detect_topic(self, query: str) -> str:
-        text = query.lower()
+        # One automaton/regex scan over the query instead of a substring search per keyword.
         scores: Dict[str, int] = {topic: 0 for topic in self.topic_keywords}
-
-        for topic, keys in self.topic_keywords.items():
-            for key in keys:
-                if key in text:
-                    scores[topic] += 1
+        for key in self._matched_keywords(query.lower()):
+            for topic in self._keyword_topics[key]:
+                scores[topic] += 1
 
         best_topic, best_score = "general", 0
         for topic, score in scores.items():
@@ -37,17 +104,33 @@ class TopicRouter:
                 best_topic, best_score = topic, score
         return best_topic
 
-    def route(self, query: str, agents: List[AgentConfig], max_agents: int | None = None) -> Tuple[str, List[AgentConfig]]:
+    def route(
+        self,
+        query: str,
+        agents: List[AgentConfig] | None,
+        max_agents: int | None = None,
+    ) -> Tuple[str, List[AgentConfig]]:
+        # agents=None routes over the pool registered with index_agents().
         topic = self.detect_topic(query)
 
-        if topic == "general":
-            candidates = [a for a in agents if a.enabled]
+        if agents is None:
+            candidates = list((self._by_topic.get(topic) if topic != "general" else None) or self._enabled_sorted)
         else:
-            candidates = [a for a in agents if a.enabled and (topic in a.topic_tags or "general" in a.topic_tags)]
-            if not candidates:
+            if topic == "general":
                 candidates = [a for a in agents if a.enabled]
+            else:
+                candidates = [a for a in agents if a.enabled and (topic in a.topic_set or "general" in a.topic_set)]
+                if not candidates:
+                    candidates = [a for a in agents if a.enabled]
+            candidates = sorted(candidates, key=lambda a: a.base_weight, reverse=True)
+
+        if max_agents is None or max_agents <= 0 or len(candidates) <= max_agents:
+            return topic, candidates
+        if self.routing_mode == "weight":
+            return topic, candidates[:max_agents]
 
-        candidates = sorted(candidates, key=lambda a: a.base_weight, reverse=True)
-        if max_agents is not None and max_agents > 0:
-            candidates = candidates[:max_agents]
-        return topic, candidates
+        # Same prompt prefix -> same agents, so upstream KV caches for that prefix stay warm.
+        pool = candidates if self.routing_mode == "hash" else candidates[: 2 * max_agents]
+        offset = self._prefix_hash(query) % len(pool)
+        chosen = {id(agent) for agent in (pool[offset:] + pool[:offset])[:max_agents]}
+        return topic, [agent for agent in pool if id(agent) in chosen]
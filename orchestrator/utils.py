@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import random
@@ -8,13 +9,18 @@ from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
 try:
     import numpy as np
 except Exception:  # pragma: no cover
     np = None
 
+try:
+    import orjson
+except Exception:  # pragma: no cover
+    orjson = None
+
 try:
     import psutil
 except Exception:  # pragma: no cover
@@ -35,6 +41,12 @@ import yaml
 _JSON_PATTERN = re.compile(r"\{.*\}", re.DOTALL)
 _NON_ALNUM = re.compile(r"[^a-z0-9\-\.\s]")
 _WS = re.compile(r"\s+")
+_MCQ_FULL = re.compile(r"\s*([a-d])\s*[\.\)\:\-]?\s*")
+_MCQ_PREFIX = re.compile(r"^\s*([a-d])\s*[\.\)\:\-]\s+.+$")
+_ANSWER_PATTERNS = (
+    re.compile(r"final answer\s*[:\-]\s*(.+)", re.IGNORECASE),
+    re.compile(r"answer\s*[:\-]\s*(.+)", re.IGNORECASE),
+)
 
 
 @dataclass
@@ -48,6 +60,17 @@ class AgentConfig:
     base_weight: float = 1.0
     topic_tags: List[str] = field(default_factory=lambda: ["general"])
     enabled: bool = True
+    url: str = ""
+    health_url: str = ""
+    topic_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Endpoint strings are built once here rather than per request.
+        base = f"http://{self.host}:{self.port}"
+        self.url = self.url or f"{base}/api/generate"
+        self.health_url = self.health_url or f"{base}/api/tags"
+        # Set view of topic_tags for O(1) membership checks while routing.
+        self.topic_set = frozenset(self.topic_tags)
 
 
 
@@ -81,10 +104,17 @@ def ensure_parent(path: str | Path) -> None:
 
 
 
+def jsonl_line(payload: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+    return (json.dumps(payload, ensure_ascii=True) + "\n").encode("utf-8")
+
+
+
 def append_jsonl(path: str | Path, payload: Dict[str, Any]) -> None:
     ensure_parent(path)
-    with Path(path).open("a", encoding="utf-8") as fh:
-        fh.write(json.dumps(payload, ensure_ascii=True) + "\n")
+    with Path(path).open("ab") as fh:
+        fh.write(jsonl_line(payload))
 
 
 
@@ -125,10 +155,10 @@ def normalize_answer(value: Any) -> str:
     value = value.replace("**", "").replace("`", "")
 
     # Preserve MCQ option letters when models answer like "B", "B.", or "B. ...".
-    single_option = re.fullmatch(r"\s*([a-d])\s*[\.\)\:\-]?\s*", value)
+    single_option = _MCQ_FULL.fullmatch(value)
     if single_option:
         return single_option.group(1)
-    prefixed_option = re.match(r"^\s*([a-d])\s*[\.\)\:\-]\s+.+$", value)
+    prefixed_option = _MCQ_PREFIX.match(value)
     if prefixed_option:
         return prefixed_option.group(1)
 
@@ -147,12 +177,8 @@ def extract_answer(raw_text: str, parsed: Optional[Dict[str, Any]] = None) -> st
             if answer_text:
                 return answer_text
 
-    patterns = [
-        r"final answer\s*[:\-]\s*(.+)",
-        r"answer\s*[:\-]\s*(.+)",
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, raw_text, flags=re.IGNORECASE)
+    for pattern in _ANSWER_PATTERNS:
+        match = pattern.search(raw_text)
         if match:
             return match.group(1).splitlines()[0].strip()
 
@@ -173,7 +199,8 @@ def parse_confidence(value: Any, default: float = 0.5) -> float:
 
 
 def approx_token_count(text: str) -> int:
-    return max(1, len(re.findall(r"\w+", text or "")))
+    # Whitespace split: close to a word count for short answers, without building a regex match list.
+    return max(1, len((text or "").split()))
 
 
 
@@ -193,21 +220,15 @@ def set_global_seed(seed: int, deterministic: bool = True) -> None:
 
 
 def pairwise_agreement(answers: List[str]) -> float:
-    clean = [normalize_answer(ans) for ans in answers if normalize_answer(ans)]
+    clean = [ans for ans in map(normalize_answer, answers) if ans]
     n = len(clean)
     if n <= 1:
         return 1.0
 
-    agree = 0
-    total = 0
-    for i in range(n):
-        for j in range(i + 1, n):
-            total += 1
-            if clean[i] == clean[j]:
-                agree += 1
-    if total == 0:
-        return 1.0
-    return agree / total
+    # Equal pairs per answer are c*(c-1)/2, so the agreement rate needs no pairwise loop.
+    agree = sum(c * (c - 1) // 2 for c in Counter(clean).values())
+    total = n * (n - 1) // 2
+    return agree / total if total else 1.0
 
 
 
@@ -221,8 +242,13 @@ def most_common(items: List[str]) -> Tuple[str, int]:
 
 
 def token_f1(prediction: str, truth: str) -> float:
+    return token_f1_from_tokens(prediction, tuple(normalize_answer(truth).split()))
+
+
+
+def token_f1_from_tokens(prediction: str, truth_tokens: Tuple[str, ...]) -> float:
+    # Same as token_f1, for callers that already hold the normalized truth tokens.
     pred_tokens = normalize_answer(prediction).split()
-    truth_tokens = normalize_answer(truth).split()
     if not pred_tokens and not truth_tokens:
         return 1.0
     if not pred_tokens or not truth_tokens:
@@ -230,7 +256,13 @@ def token_f1(prediction: str, truth: str) -> float:
 
     pred_counts = Counter(pred_tokens)
     truth_counts = Counter(truth_tokens)
-    common = sum((pred_counts & truth_counts).values())
+    # One walk over the smaller Counter instead of building the `&` intersection Counter.
+    small, large = (pred_counts, truth_counts) if len(pred_counts) <= len(truth_counts) else (truth_counts, pred_counts)
+    common = 0
+    for token, count in small.items():
+        other = large.get(token)
+        if other:
+            common += count if count < other else other
     if common == 0:
         return 0.0
 
@@ -240,15 +272,36 @@ def token_f1(prediction: str, truth: str) -> float:
 
 
 
-def _gpu_usage_via_nvml() -> List[Dict[str, Any]]:
+def init_nvml() -> List[Any] | None:
+    # Opens an NVML session and returns its device handles; None when NVML is unavailable.
     if pynvml is None:
-        return []
-    devices: List[Dict[str, Any]] = []
+        return None
     try:
         pynvml.nvmlInit()
-        count = pynvml.nvmlDeviceGetCount()
-        for idx in range(count):
-            handle = pynvml.nvmlDeviceGetHandleByIndex(idx)
+    except Exception:
+        return None
+    try:
+        return [pynvml.nvmlDeviceGetHandleByIndex(idx) for idx in range(pynvml.nvmlDeviceGetCount())]
+    except Exception:
+        shutdown_nvml()
+        return None
+
+
+
+def shutdown_nvml() -> None:
+    if pynvml is None:
+        return
+    try:
+        pynvml.nvmlShutdown()
+    except Exception:
+        pass
+
+
+
+def _gpu_usage_from_handles(handles: List[Any]) -> List[Dict[str, Any]]:
+    devices: List[Dict[str, Any]] = []
+    try:
+        for idx, handle in enumerate(handles):
             util = pynvml.nvmlDeviceGetUtilizationRates(handle)
             mem = pynvml.nvmlDeviceGetMemoryInfo(handle)
             name = pynvml.nvmlDeviceGetName(handle)
@@ -265,16 +318,23 @@ def _gpu_usage_via_nvml() -> List[Dict[str, Any]]:
             )
     except Exception:
         return []
-    finally:
-        try:
-            pynvml.nvmlShutdown()
-        except Exception:
-            pass
     return devices
 
 
 
-def get_resource_usage() -> Dict[str, Any]:
+def _gpu_usage_via_nvml() -> List[Dict[str, Any]]:
+    handles = init_nvml()
+    if handles is None:
+        return []
+    try:
+        return _gpu_usage_from_handles(handles)
+    finally:
+        shutdown_nvml()
+
+
+
+def get_resource_usage(nvml_handles: List[Any] | None = None) -> Dict[str, Any]:
+    # With handles from an open init_nvml() session, skip the per-call NVML init/shutdown.
     usage: Dict[str, Any] = {
         "cpu_percent": None,
         "memory_percent": None,
@@ -289,13 +349,22 @@ def get_resource_usage() -> Dict[str, Any]:
             usage["memory_used_mb"] = round(float(vm.used) / (1024**2), 2)
         except Exception:
             pass
-    usage["gpu"] = _gpu_usage_via_nvml()
+    usage["gpu"] = _gpu_usage_from_handles(nvml_handles) if nvml_handles is not None else _gpu_usage_via_nvml()
     return usage
 
 
 
+def deterministic_floats(key: str, n: int) -> List[float]:
+    # n uniform floats in [0, 1) sliced from one blake2b digest; no Mersenne Twister seeding.
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8 * n).digest()
+    return [int.from_bytes(digest[i * 8 : (i + 1) * 8], "little") / 2**64 for i in range(n)]
+
+
+
 def stable_choice(options: List[str], key: str) -> str:
     if not options:
         return ""
-    idx = abs(hash(key)) % len(options)
-    return options[idx]
+    # Content digest rather than hash(): str hashes are salted per process unless PYTHONHASHSEED is set.
+    # Always blake2b, so the pick does not depend on which optional packages are installed.
+    digest = int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "little")
+    return options[digest % len(options)]
@@ -4,19 +4,25 @@ from __future__ import annotations
 import argparse
 import asyncio
 from datetime import datetime
+from itertools import chain
 from pathlib import Path
 from typing import Any, Dict, List
 
-from benchmarks.gsm8k_runner import load_gsm8k_samples
-from benchmarks.mmlu_runner import load_mmlu_samples
-from benchmarks.truthfulqa_runner import load_truthfulqa_samples
+try:
+    import uvloop
+except Exception:  # pragma: no cover
+    uvloop = None
+
+from benchmarks.gsm8k_runner import load_gsm8k_samples_async
+from benchmarks.mmlu_runner import load_mmlu_samples_async
+from benchmarks.truthfulqa_runner import load_truthfulqa_samples_async
 from orchestrator.evaluator import BenchmarkEvaluator, save_overall_reports
 
 
-BENCHMARK_LOADERS = {
-    "mmlu": load_mmlu_samples,
-    "gsm8k": load_gsm8k_samples,
-    "truthfulqa": load_truthfulqa_samples,
+ASYNC_BENCHMARK_LOADERS = {
+    "mmlu": load_mmlu_samples_async,
+    "gsm8k": load_gsm8k_samples_async,
+    "truthfulqa": load_truthfulqa_samples_async,
 }
 
 
@@ -33,6 +39,9 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--deterministic", action="store_true", help="Force deterministic mode")
     parser.add_argument("--max-agents", type=int, default=None)
     parser.add_argument("--mock-mode", action="store_true", help="Use orchestrator mock agents for simulation")
+    parser.add_argument("--concurrency", type=int, default=1, help="Max in-flight /query requests per benchmark (values above 1 reorder the online weight updates, so weighted/topic results depend on scheduling)")
+    parser.add_argument("--batch-size", type=int, default=1, help="Samples per /query/batch request for direct strategies (1 sends one /query per sample)")
+    parser.add_argument("--max-concurrent-benchmarks", type=int, default=1, help="Benchmarks evaluated at the same time (above 1 their weight updates interleave on the shared orchestrator)")
     parser.add_argument("--output-dir", default=None, help="Output directory for results")
     return parser.parse_args()
 
@@ -47,34 +56,43 @@ async def main() -> None:
     output_dir = Path(args.output_dir or f"results/run_{run_stamp}")
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    evaluator = BenchmarkEvaluator(
-        orchestrator_url=args.orchestrator_url,
-        output_root=str(output_dir),
-    )
-
-    all_summary: List[Dict[str, Any]] = []
-    all_significance: List[Dict[str, Any]] = []
-
     for bench in selected_benchmarks:
-        if bench not in BENCHMARK_LOADERS:
+        if bench not in ASYNC_BENCHMARK_LOADERS:
             raise ValueError(f"Unsupported benchmark: {bench}")
-        loader = BENCHMARK_LOADERS[bench]
-        samples = loader(limit=args.samples_per_benchmark, seed=args.seed)
-
-        result = await evaluator.run_benchmark(
-            benchmark_name=bench,
-            samples=samples,
-            strategies=strategies,
-            repetitions=args.repetitions,
-            seed=args.seed,
-            temperature=args.temperature,
-            deterministic=args.deterministic,
-            max_agents=args.max_agents,
-            mock_mode=args.mock_mode,
+
+    # Load every selected dataset concurrently before evaluating.
+    loaded_samples = await asyncio.gather(
+        *(
+            ASYNC_BENCHMARK_LOADERS[bench](limit=args.samples_per_benchmark, seed=args.seed)
+            for bench in selected_benchmarks
         )
+    )
+
+    specs = [
+        {
+            "benchmark_name": bench,
+            "samples": samples,
+            "strategies": strategies,
+            "repetitions": args.repetitions,
+            "seed": args.seed,
+            "temperature": args.temperature,
+            "deterministic": args.deterministic,
+            "max_agents": args.max_agents,
+            "mock_mode": args.mock_mode,
+        }
+        for bench, samples in zip(selected_benchmarks, loaded_samples)
+    ]
+    async with BenchmarkEvaluator(
+        orchestrator_url=args.orchestrator_url,
+        output_root=str(output_dir),
+        concurrency=args.concurrency,
+        batch_size=args.batch_size,
+        max_concurrent_benchmarks=args.max_concurrent_benchmarks,
+    ) as evaluator:
+        results = await evaluator.run_many(specs)
 
-        all_summary.extend(result["summary"])
-        all_significance.extend(result["significance"])
+    all_summary: List[Dict[str, Any]] = list(chain.from_iterable(result["summary"] for result in results))
+    all_significance: List[Dict[str, Any]] = list(chain.from_iterable(result["significance"] for result in results))
 
     save_overall_reports(
         output_root=str(output_dir),
@@ -86,4 +104,8 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # libuv-backed event loop for the many concurrent /query calls; uvloop is not available on Windows.
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
@@ -1,19 +1,26 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-import csv
+import hashlib
 import json
-import math
+import os
+import re
 import shutil
-from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Tuple
 
-import matplotlib
-
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt
 import numpy as np
+import pandas as pd
+
+try:
+    import orjson
+except Exception:  # pragma: no cover
+    orjson = None
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
 
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -25,28 +32,41 @@ DOC_FIG_DIR = ROOT / "docs" / "assets" / "figures"
 DOC_DATA_DIR = ROOT / "docs" / "assets" / "data"
 PAPER_FIG_DIR = ROOT / "paper" / "figures"
 PAPER_TABLE_DIR = ROOT / "paper" / "tables"
+# Chart name -> cache key and output path of the last render; see figure_cache_key.
+FIGURE_CACHE_PATH = DOC_DATA_DIR / ".figcache.json"
 
 BENCHMARKS = ["mmlu", "gsm8k", "truthfulqa"]
 STRATEGIES = ["majority", "weighted", "isp", "topic", "debate"]
+OPTIMIZATION_COLUMNS = ["accuracy", "latency_mean_ms"]
+SIGNIFICANCE_COLUMNS = ["benchmark", "comparison", "mean_delta", "paired_t_p", "wilcoxon_p"]
+# Docs figures favour fast encodes at screen resolution; paper figures are saved again at print resolution.
+SAVE_KW: Dict[str, Any] = {"dpi": 120, "bbox_inches": "tight", "pil_kwargs": {"compress_level": 1}}
+PAPER_SAVE_KW: Dict[str, Any] = {"dpi": 300, "bbox_inches": "tight"}
+# Longer progress curves are thinned to this many points before plotting.
+PROGRESS_MAX_POINTS = 2400
 
+_FIGURE: Figure | None = None
 
-def read_csv(path: Path) -> List[Dict[str, str]]:
-    with path.open("r", encoding="utf-8", newline="") as fh:
-        return list(csv.DictReader(fh))
+# Matrix name -> overall_summary.csv column.
+MATRIX_COLUMNS = {
+    "accuracy": "accuracy",
+    "latency": "latency_mean_ms",
+    "f1": "f1",
+    "agreement": "agreement_rate",
+}
 
 
-def as_float(value: Any, default: float = 0.0) -> float:
-    try:
-        return float(value)
-    except Exception:
-        return default
+def as_float_series(values: pd.Series, default: float = 0.0) -> pd.Series:
+    # float() per cell: unparseable cells become `default`, literal "nan" stays NaN.
+    text = values.str.strip()
+    valid = pd.to_numeric(text, errors="coerce").notna() | (text.str.lower().str.lstrip("+-") == "nan")
+    # astype(float) parses with float() itself, so values round-trip exactly.
+    return text.where(valid, "nan").astype(float).where(valid, default)
 
 
-def as_pvalue(value: Any) -> float:
-    v = as_float(value, 1.0)
-    if math.isnan(v) or math.isinf(v):
-        return 1.0
-    return v
+def as_pvalue_series(values: pd.Series) -> pd.Series:
+    v = as_float_series(values, 1.0)
+    return v.where(np.isfinite(v), 1.0)
 
 
 def prepare_dirs() -> None:
@@ -54,33 +74,79 @@ def prepare_dirs() -> None:
         path.mkdir(parents=True, exist_ok=True)
 
 
-def build_matrices(rows: List[Dict[str, str]]) -> Dict[str, Dict[str, Dict[str, float]]]:
-    metrics: Dict[str, Dict[str, Dict[str, float]]] = {
-        "accuracy": {b: {s: 0.0 for s in STRATEGIES} for b in BENCHMARKS},
-        "latency": {b: {s: 0.0 for s in STRATEGIES} for b in BENCHMARKS},
-        "f1": {b: {s: 0.0 for s in STRATEGIES} for b in BENCHMARKS},
-        "agreement": {b: {s: 0.0 for s in STRATEGIES} for b in BENCHMARKS},
+def build_matrices(path: Path) -> Dict[str, np.ndarray]:
+    # One (len(BENCHMARKS), len(STRATEGIES)) array per metric, rows/columns in constant order.
+    columns = list(MATRIX_COLUMNS.values())
+    wanted = {"benchmark", "strategy", *columns}
+    df = pd.read_csv(path, usecols=lambda col: col in wanted, dtype=str, keep_default_na=False)
+    df = df.reindex(columns=["benchmark", "strategy", *columns], fill_value="")
+    df["benchmark"] = df["benchmark"].str.lower()
+    df["strategy"] = df["strategy"].str.lower()
+    # The last row for a (benchmark, strategy) pair wins; pairs without a row are 0.0.
+    df = df.drop_duplicates(["benchmark", "strategy"], keep="last").set_index(["benchmark", "strategy"])
+    grid = pd.MultiIndex.from_product([BENCHMARKS, STRATEGIES], names=["benchmark", "strategy"])
+    values = pd.DataFrame({column: as_float_series(df[column]) for column in columns}).reindex(grid, fill_value=0.0)
+    return {
+        name: values[column].unstack("strategy").reindex(index=BENCHMARKS, columns=STRATEGIES).to_numpy(np.float64)
+        for name, column in MATRIX_COLUMNS.items()
     }
-    for row in rows:
-        b = row.get("benchmark", "").lower()
-        s = row.get("strategy", "").lower()
-        if b not in BENCHMARKS or s not in STRATEGIES:
-            continue
-        metrics["accuracy"][b][s] = as_float(row.get("accuracy"))
-        metrics["latency"][b][s] = as_float(row.get("latency_mean_ms"))
-        metrics["f1"][b][s] = as_float(row.get("f1"))
-        metrics["agreement"][b][s] = as_float(row.get("agreement_rate"))
-    return metrics
 
 
-def write_bar_chart_accuracy(metrics: Dict[str, Dict[str, Dict[str, float]]]) -> Path:
+def matrix_to_dict(matrix: np.ndarray) -> Dict[str, Dict[str, float]]:
+    return {b: dict(zip(STRATEGIES, row)) for b, row in zip(BENCHMARKS, matrix.tolist())}
+
+
+def strategy_means(metrics: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    # Per-strategy mean over benchmarks for every metric, as arrays aligned with STRATEGIES.
+    return {name: matrix.mean(axis=0) for name, matrix in metrics.items()}
+
+
+@lru_cache(maxsize=None)
+def _matplotlib() -> Tuple[Any, Any]:
+    # Imported on first use so loading this module without drawing skips matplotlib entirely.
+    import matplotlib
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    matplotlib.rcParams["path.simplify"] = True
+    matplotlib.rcParams["path.simplify_threshold"] = 1.0
+    matplotlib.rcParams["agg.path.chunksize"] = 10000
+    return Figure, FigureCanvasAgg
+
+
+def reset_figure(figsize: Tuple[float, float]) -> Figure:
+    # One Agg figure per process, cleared between charts, instead of a new pyplot figure each time.
+    global _FIGURE
+    if _FIGURE is None:
+        figure_cls, canvas_cls = _matplotlib()
+        _FIGURE = figure_cls(figsize=figsize)
+        canvas_cls(_FIGURE)
+    else:
+        _FIGURE.clear()
+        _FIGURE.set_size_inches(figsize)
+    return _FIGURE
+
+
+def save_figure(fig: Figure, name: str) -> Path:
+    out = DOC_FIG_DIR / name
+    paper_out = PAPER_FIG_DIR / name
+    for path in (out, paper_out):
+        # Break hardlinks from mirror_file so the two resolutions do not overwrite each other.
+        if path.exists() and path.stat().st_nlink > 1:
+            path.unlink()
+    fig.savefig(out, **SAVE_KW)
+    fig.savefig(paper_out, **PAPER_SAVE_KW)
+    return out
+
+
+def write_bar_chart_accuracy(metrics: Dict[str, np.ndarray]) -> Path:
     x = np.arange(len(STRATEGIES))
     width = 0.25
-    fig, ax = plt.subplots(figsize=(12, 6))
+    fig = reset_figure((12, 6))
+    ax = fig.add_subplot()
 
     for idx, benchmark in enumerate(BENCHMARKS):
-        vals = [metrics["accuracy"][benchmark][s] for s in STRATEGIES]
-        ax.bar(x + (idx - 1) * width, vals, width, label=benchmark.upper())
+        ax.bar(x + (idx - 1) * width, metrics["accuracy"][idx], width, label=benchmark.upper())
 
     ax.set_xticks(x)
     ax.set_xticklabels([s.title() for s in STRATEGIES])
@@ -90,20 +156,17 @@ def write_bar_chart_accuracy(metrics: Dict[str, Dict[str, Dict[str, float]]]) ->
     ax.legend()
     ax.grid(axis="y", alpha=0.2)
 
-    out = DOC_FIG_DIR / "accuracy_bar_chart.png"
     fig.tight_layout()
-    fig.savefig(out, dpi=180)
-    plt.close(fig)
-    return out
+    return save_figure(fig, "accuracy_bar_chart.png")
 
 
-def write_line_chart_latency(metrics: Dict[str, Dict[str, Dict[str, float]]]) -> Path:
-    fig, ax = plt.subplots(figsize=(12, 6))
+def write_line_chart_latency(metrics: Dict[str, np.ndarray]) -> Path:
+    fig = reset_figure((12, 6))
+    ax = fig.add_subplot()
     x = np.arange(len(STRATEGIES))
 
-    for benchmark in BENCHMARKS:
-        vals = [metrics["latency"][benchmark][s] for s in STRATEGIES]
-        ax.plot(x, vals, marker="o", linewidth=2, label=benchmark.upper())
+    for idx, benchmark in enumerate(BENCHMARKS):
+        ax.plot(x, metrics["latency"][idx], marker="o", linewidth=2, label=benchmark.upper())
 
     ax.set_xticks(x)
     ax.set_xticklabels([s.title() for s in STRATEGIES])
@@ -112,64 +175,75 @@ def write_line_chart_latency(metrics: Dict[str, Dict[str, Dict[str, float]]]) ->
     ax.grid(alpha=0.2)
     ax.legend()
 
-    out = DOC_FIG_DIR / "latency_line_chart.png"
     fig.tight_layout()
-    fig.savefig(out, dpi=180)
-    plt.close(fig)
-    return out
+    return save_figure(fig, "latency_line_chart.png")
 
 
-def write_pie_chart_avg_accuracy(metrics: Dict[str, Dict[str, Dict[str, float]]]) -> Path:
-    avg = []
-    for strategy in STRATEGIES:
-        vals = [metrics["accuracy"][b][strategy] for b in BENCHMARKS]
-        avg.append(sum(vals) / len(vals))
+def write_pie_chart_avg_accuracy(means: Dict[str, np.ndarray]) -> Path:
+    avg = means["accuracy"]
+    if avg.sum() <= 0:
+        avg = np.ones(len(STRATEGIES))
 
-    total = sum(avg)
-    if total <= 0:
-        avg = [1.0 for _ in STRATEGIES]
-
-    fig, ax = plt.subplots(figsize=(8, 8))
+    fig = reset_figure((8, 8))
+    ax = fig.add_subplot()
     ax.pie(avg, labels=[s.title() for s in STRATEGIES], autopct="%1.1f%%", startangle=90)
     ax.set_title("Average Accuracy Share by Strategy")
 
-    out = DOC_FIG_DIR / "accuracy_share_pie_chart.png"
     fig.tight_layout()
-    fig.savefig(out, dpi=180)
-    plt.close(fig)
-    return out
+    return save_figure(fig, "accuracy_share_pie_chart.png")
 
 
+_NON_DIGITS = re.compile(r"\D+")
+
+
+@lru_cache(maxsize=None)
 def _sample_sort_key(sample_id: str) -> int:
-    digits = "".join(ch for ch in str(sample_id) if ch.isdigit())
+    # Sample ids repeat across strategies and repetitions, so each is parsed once.
+    digits = _NON_DIGITS.sub("", str(sample_id))
     return int(digits) if digits else 0
 
 
-def write_progress_chart(raw_rows: List[Dict[str, str]]) -> Path:
-    fig, ax = plt.subplots(figsize=(12, 6))
+def gsm8k_progress(path: Path) -> Dict[str, np.ndarray]:
+    # Cumulative GSM8K accuracy per strategy, in (repetition, sample) order with ties kept in file order.
+    # Rows without a usable `correct` value are left out rather than counted as wrong answers.
+    wanted = ["benchmark", "strategy", "repetition", "sample_id", "correct"]
+    df = pd.read_csv(path, usecols=lambda col: col in wanted, dtype=str, keep_default_na=False)
+    df = df.reindex(columns=wanted, fill_value="")
+    strategy = df["strategy"].str.lower()
+    correct = as_float_series(df["correct"], float("nan"))
+    df = pd.DataFrame(
+        {
+            "strategy": strategy,
+            "repetition": np.trunc(as_float_series(df["repetition"])),
+            "sample": df["sample_id"].map(_sample_sort_key),
+            "correct": correct,
+        }
+    )[df["benchmark"].str.lower().eq("gsm8k") & strategy.isin(STRATEGIES) & correct.notna()]
+    df = df.sort_values(["repetition", "sample"], kind="stable")
 
+    # np.cumsum rather than groupby().cumsum(): pandas' compensated sum would shift the last digits.
+    by_strategy = {name: group.to_numpy(np.float64) for name, group in df["correct"].groupby(df["strategy"], sort=False)}
+    progress: Dict[str, np.ndarray] = {}
     for strategy in STRATEGIES:
-        subset = [
-            r
-            for r in raw_rows
-            if r.get("strategy", "").lower() == strategy and r.get("benchmark", "").lower() == "gsm8k"
-        ]
-        subset.sort(
-            key=lambda r: (
-                int(as_float(r.get("repetition"), 0.0)),
-                _sample_sort_key(r.get("sample_id", "0")),
-            )
-        )
-        if not subset:
-            continue
+        correct = by_strategy.get(strategy, np.empty(0))
+        progress[strategy] = np.cumsum(correct) / np.arange(1, correct.size + 1, dtype=np.float64)
+    return progress
+
 
-        cumulative: List[float] = []
-        running = 0.0
-        for idx, row in enumerate(subset, start=1):
-            running += as_float(row.get("correct"), 0.0)
-            cumulative.append(running / idx)
+def write_progress_chart(progress: Dict[str, np.ndarray]) -> Path:
+    fig = reset_figure((12, 6))
+    ax = fig.add_subplot()
 
-        ax.plot(range(1, len(cumulative) + 1), cumulative, linewidth=2, label=strategy.title())
+    for strategy in STRATEGIES:
+        cumulative = progress[strategy]
+        if not cumulative.size:
+            continue
+        x = np.arange(1, cumulative.size + 1)
+        if cumulative.size > PROGRESS_MAX_POINTS:
+            # Evenly spaced samples (first and last kept) keep the path short; the curve is smooth by then.
+            idx = np.linspace(0, cumulative.size - 1, PROGRESS_MAX_POINTS).astype(int)
+            x, cumulative = x[idx], cumulative[idx]
+        ax.plot(x, cumulative, linewidth=2, label=strategy.title(), rasterized=True)
 
     ax.set_xlabel("GSM8K Query Index")
     ax.set_ylabel("Cumulative Accuracy")
@@ -178,27 +252,31 @@ def write_progress_chart(raw_rows: List[Dict[str, str]]) -> Path:
     ax.grid(alpha=0.2)
     ax.legend()
 
-    out = DOC_FIG_DIR / "progress_cumulative_accuracy_line.png"
     fig.tight_layout()
-    fig.savefig(out, dpi=180)
-    plt.close(fig)
-    return out
+    return save_figure(fig, "progress_cumulative_accuracy_line.png")
 
 
-def write_optimization_chart() -> Path:
-    baseline_rows = read_csv(OPT_DIR / "gsm8k_baseline_summary.csv")
-    optimized_rows = read_csv(OPT_DIR / "gsm8k_optimized_summary.csv")
+def load_optimization_summary(path: Path) -> pd.DataFrame:
+    # Accuracy/latency per lowercased strategy, in first-seen order; a repeated strategy takes its last row.
+    df = pd.read_csv(path, usecols=lambda col: col in {"strategy", *OPTIMIZATION_COLUMNS}, dtype=str, keep_default_na=False)
+    df = df.reindex(columns=["strategy", *OPTIMIZATION_COLUMNS], fill_value="")
+    df = df.set_index(df.pop("strategy").str.lower())
+    df = df[~df.index.duplicated(keep="last")].reindex(df.index.unique())
+    return pd.DataFrame({column: as_float_series(df[column]) for column in OPTIMIZATION_COLUMNS}, index=df.index)
 
-    base = {row["strategy"].lower(): row for row in baseline_rows}
-    opt = {row["strategy"].lower(): row for row in optimized_rows}
+
+def write_optimization_chart(baseline: pd.DataFrame, optimized: pd.DataFrame) -> Path:
+    base = baseline.reindex(STRATEGIES, fill_value=0.0)
+    opt = optimized.reindex(STRATEGIES, fill_value=0.0)
 
     x = np.arange(len(STRATEGIES))
     width = 0.36
 
-    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 9), sharex=True)
+    fig = reset_figure((12, 9))
+    ax1, ax2 = fig.subplots(2, 1, sharex=True)
 
-    base_latency = [as_float(base.get(s, {}).get("latency_mean_ms", 0.0)) for s in STRATEGIES]
-    opt_latency = [as_float(opt.get(s, {}).get("latency_mean_ms", 0.0)) for s in STRATEGIES]
+    base_latency = base["latency_mean_ms"].to_numpy(np.float64)
+    opt_latency = opt["latency_mean_ms"].to_numpy(np.float64)
     ax1.bar(x - width / 2, base_latency, width, label="Baseline")
     ax1.bar(x + width / 2, opt_latency, width, label="Optimized")
     ax1.set_ylabel("Latency (ms)")
@@ -206,8 +284,8 @@ def write_optimization_chart() -> Path:
     ax1.grid(axis="y", alpha=0.2)
     ax1.legend()
 
-    base_acc = [as_float(base.get(s, {}).get("accuracy", 0.0)) for s in STRATEGIES]
-    opt_acc = [as_float(opt.get(s, {}).get("accuracy", 0.0)) for s in STRATEGIES]
+    base_acc = base["accuracy"].to_numpy(np.float64)
+    opt_acc = opt["accuracy"].to_numpy(np.float64)
     ax2.bar(x - width / 2, base_acc, width, label="Baseline")
     ax2.bar(x + width / 2, opt_acc, width, label="Optimized")
     ax2.set_ylabel("Accuracy")
@@ -218,156 +296,154 @@ def write_optimization_chart() -> Path:
     ax2.grid(axis="y", alpha=0.2)
     ax2.legend()
 
-    out = DOC_FIG_DIR / "optimization_progress_bar_chart.png"
     fig.tight_layout()
-    fig.savefig(out, dpi=180)
-    plt.close(fig)
-    return out
+    return save_figure(fig, "optimization_progress_bar_chart.png")
 
 
 def build_report_json(
-    metrics: Dict[str, Dict[str, Dict[str, float]]],
-    raw_rows: List[Dict[str, str]],
-    significance_rows: List[Dict[str, str]],
+    metrics: Dict[str, np.ndarray],
+    means: Dict[str, np.ndarray],
+    progress: Dict[str, np.ndarray],
+    significance: pd.DataFrame,
     optimization: Dict[str, Dict[str, Dict[str, float]]],
 ) -> Dict[str, Any]:
-    avg_accuracy = {}
-    avg_latency = {}
-    for strategy in STRATEGIES:
-        acc_vals = [metrics["accuracy"][b][strategy] for b in BENCHMARKS]
-        lat_vals = [metrics["latency"][b][strategy] for b in BENCHMARKS]
-        avg_accuracy[strategy] = sum(acc_vals) / len(acc_vals)
-        avg_latency[strategy] = sum(lat_vals) / len(lat_vals)
-
-    progress = {}
-    for strategy in STRATEGIES:
-        subset = [
-            r
-            for r in raw_rows
-            if r.get("strategy", "").lower() == strategy and r.get("benchmark", "").lower() == "gsm8k"
-        ]
-        subset.sort(
-            key=lambda r: (
-                int(as_float(r.get("repetition"), 0.0)),
-                _sample_sort_key(r.get("sample_id", "0")),
-            )
-        )
-        running = 0.0
-        cumulative: List[float] = []
-        for idx, row in enumerate(subset, start=1):
-            running += as_float(row.get("correct"), 0.0)
-            cumulative.append(running / idx)
-        progress[strategy] = cumulative
+    avg_accuracy = dict(zip(STRATEGIES, means["accuracy"].tolist()))
+    avg_latency = dict(zip(STRATEGIES, means["latency"].tolist()))
 
     return {
         "run_id": RUN_ID,
         "benchmarks": BENCHMARKS,
         "strategies": STRATEGIES,
-        "accuracy": metrics["accuracy"],
-        "latency_ms": metrics["latency"],
-        "f1": metrics["f1"],
-        "agreement": metrics["agreement"],
+        "accuracy": matrix_to_dict(metrics["accuracy"]),
+        "latency_ms": matrix_to_dict(metrics["latency"]),
+        "f1": matrix_to_dict(metrics["f1"]),
+        "agreement": matrix_to_dict(metrics["agreement"]),
         "avg_accuracy": avg_accuracy,
         "avg_latency_ms": avg_latency,
         "progress_gsm8k": progress,
-        "significance": significance_rows,
+        "significance": significance.to_dict(orient="records"),
         "optimization": optimization,
     }
 
 
+def _json_default(value: Any) -> Any:
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
 def write_report_data(report: Dict[str, Any]) -> None:
     json_path = DOC_DATA_DIR / "report_data.json"
     js_path = DOC_DATA_DIR / "report_data.js"
-    json_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
-    js_path.write_text("window.REPORT_DATA = " + json.dumps(report, indent=2) + ";\n", encoding="utf-8")
-
-
-def write_paper_tables(metrics: Dict[str, Dict[str, Dict[str, float]]], significance_rows: List[Dict[str, str]]) -> None:
-    avg_rows = []
-    for strategy in STRATEGIES:
-        acc = [metrics["accuracy"][b][strategy] for b in BENCHMARKS]
-        f1 = [metrics["f1"][b][strategy] for b in BENCHMARKS]
-        lat = [metrics["latency"][b][strategy] for b in BENCHMARKS]
-        agr = [metrics["agreement"][b][strategy] for b in BENCHMARKS]
-        avg_rows.append((strategy, sum(acc) / 3, sum(f1) / 3, sum(lat) / 3, sum(agr) / 3))
-
-    table_lines = [
-        "\\begin{tabular}{lcccc}",
-        "\\hline",
-        "Strategy & Avg Acc. & Avg F1 & Avg Latency (ms) & Avg Agreement \\\\",
-        "\\hline",
-    ]
-    for strategy, acc, f1, lat, agr in avg_rows:
-        table_lines.append(f"{strategy} & {acc:.3f} & {f1:.3f} & {lat:.1f} & {agr:.3f} \\\\")
-    table_lines.extend(["\\hline", "\\end{tabular}"])
-    (PAPER_TABLE_DIR / "aggregate_strategy_results.tex").write_text("\n".join(table_lines) + "\n", encoding="utf-8")
-
-    sig = []
-    seen = set()
-    for row in significance_rows:
-        t_p = as_pvalue(row.get("paired_t_p"))
-        w_p = as_pvalue(row.get("wilcoxon_p"))
-        if t_p >= 0.05 and w_p >= 0.05:
-            continue
-        key = (row.get("benchmark", ""), row.get("comparison", ""))
-        if key in seen:
-            continue
-        seen.add(key)
-        sig.append(row)
-    sig_lines = [
-        "\\begin{tabular}{lccccc}",
-        "\\hline",
-        "Comparison & Mean $\\Delta$ & t-p & Wilcoxon p & t<0.05 & W<0.05 \\\\",
-        "\\hline",
-    ]
-    for row in sig:
-        benchmark = row.get("benchmark", "")
-        comp = row.get("comparison", "")
-        if benchmark:
-            comp = f"{benchmark}: {comp}"
-        mean_delta = as_float(row.get("mean_delta"), float("nan"))
-        t_p = as_pvalue(row.get("paired_t_p"))
-        w_p = as_pvalue(row.get("wilcoxon_p"))
-        t_sig = "Yes" if t_p < 0.05 else "No"
-        w_sig = "Yes" if w_p < 0.05 else "No"
-        sig_lines.append(f"{comp} & {mean_delta:.3f} & {t_p:.4f} & {w_p:.4f} & {t_sig} & {w_sig} \\\\")
-    if not sig:
-        sig_lines.append("No significant pairs & -- & -- & -- & -- & -- \\\\")
-    sig_lines.extend(["\\hline", "\\end{tabular}"])
-    (PAPER_TABLE_DIR / "significance_highlights.tex").write_text("\n".join(sig_lines) + "\n", encoding="utf-8")
-
-    per_benchmark = []
-    for benchmark in BENCHMARKS:
-        for strategy in STRATEGIES:
-            per_benchmark.append(
-                (
-                    benchmark,
-                    strategy,
-                    metrics["accuracy"][benchmark][strategy],
-                    metrics["f1"][benchmark][strategy],
-                    metrics["latency"][benchmark][strategy],
-                    metrics["agreement"][benchmark][strategy],
-                )
-            )
-
-    detail_lines = [
-        "\\begin{tabular}{llcccc}",
+    # Serialized once and reused for the .js wrapper; orjson writes the numpy arrays directly.
+    if orjson is not None:
+        payload = orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    else:
+        payload = json.dumps(report, indent=2, default=_json_default).encode("utf-8")
+    json_path.write_bytes(payload)
+    js_path.write_bytes(b"window.REPORT_DATA = " + payload + b";\n")
+
+
+def write_latex_table(
+    path: Path,
+    table: pd.DataFrame,
+    column_format: str,
+    formats: Dict[str, str],
+    empty_row: str | None = None,
+) -> None:
+    # Same layout as the hand-written tables; DataFrame.to_latex needs jinja2 and emits booktabs rules.
+    cells = pd.DataFrame({column: table[column].map(formats.get(column, "{}").format) for column in table.columns})
+    lines = [
+        f"\\begin{{tabular}}{{{column_format}}}",
         "\\hline",
-        "Benchmark & Strategy & Accuracy & F1 & Latency (ms) & Agreement \\\\",
+        " & ".join(table.columns) + " \\\\",
         "\\hline",
     ]
-    for benchmark, strategy, acc, f1, lat, agr in per_benchmark:
-        detail_lines.append(
-            f"{benchmark} & {strategy} & {acc:.3f} & {f1:.3f} & {lat:.1f} & {agr:.3f} \\\\"
-        )
-    detail_lines.extend(["\\hline", "\\end{tabular}"])
-    (PAPER_TABLE_DIR / "per_benchmark_results.tex").write_text("\n".join(detail_lines) + "\n", encoding="utf-8")
+    if not cells.empty:
+        lines.extend(cells.agg(" & ".join, axis=1).add(" \\\\").tolist())
+    elif empty_row is not None:
+        lines.append(empty_row + " \\\\")
+    lines.extend(["\\hline", "\\end{tabular}"])
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def write_paper_tables(
+    metrics: Dict[str, np.ndarray],
+    means: Dict[str, np.ndarray],
+    significance: pd.DataFrame,
+) -> None:
+    avg_table = pd.DataFrame(
+        {
+            "Strategy": STRATEGIES,
+            "Avg Acc.": means["accuracy"],
+            "Avg F1": means["f1"],
+            "Avg Latency (ms)": means["latency"],
+            "Avg Agreement": means["agreement"],
+        }
+    )
+    write_latex_table(
+        PAPER_TABLE_DIR / "aggregate_strategy_results.tex",
+        avg_table,
+        "lcccc",
+        {"Avg Acc.": "{:.3f}", "Avg F1": "{:.3f}", "Avg Latency (ms)": "{:.1f}", "Avg Agreement": "{:.3f}"},
+    )
 
+    sig = significance.reindex(columns=SIGNIFICANCE_COLUMNS, fill_value="")
+    t_p = as_pvalue_series(sig["paired_t_p"])
+    w_p = as_pvalue_series(sig["wilcoxon_p"])
+    mask = (t_p < 0.05) | (w_p < 0.05)
+    sig = sig[mask]
+    sig = sig[~sig.duplicated(["benchmark", "comparison"])]
+    t_p, w_p = t_p[sig.index], w_p[sig.index]
+    sig_table = pd.DataFrame(
+        {
+            "Comparison": sig["comparison"].where(sig["benchmark"] == "", sig["benchmark"] + ": " + sig["comparison"]),
+            "Mean $\\Delta$": as_float_series(sig["mean_delta"], float("nan")),
+            "t-p": t_p,
+            "Wilcoxon p": w_p,
+            "t<0.05": np.where(t_p < 0.05, "Yes", "No"),
+            "W<0.05": np.where(w_p < 0.05, "Yes", "No"),
+        }
+    )
+    write_latex_table(
+        PAPER_TABLE_DIR / "significance_highlights.tex",
+        sig_table,
+        "lccccc",
+        {"Mean $\\Delta$": "{:.3f}", "t-p": "{:.4f}", "Wilcoxon p": "{:.4f}"},
+        empty_row="No significant pairs & -- & -- & -- & -- & --",
+    )
 
-def copy_figures_to_paper(figures: List[Path]) -> None:
-    for fig in figures:
-        shutil.copy2(fig, PAPER_FIG_DIR / fig.name)
+    detail_table = pd.DataFrame(
+        {
+            "Benchmark": np.repeat(BENCHMARKS, len(STRATEGIES)),
+            "Strategy": np.tile(STRATEGIES, len(BENCHMARKS)),
+            "Accuracy": metrics["accuracy"].ravel(),
+            "F1": metrics["f1"].ravel(),
+            "Latency (ms)": metrics["latency"].ravel(),
+            "Agreement": metrics["agreement"].ravel(),
+        }
+    )
+    write_latex_table(
+        PAPER_TABLE_DIR / "per_benchmark_results.tex",
+        detail_table,
+        "llcccc",
+        {"Accuracy": "{:.3f}", "F1": "{:.3f}", "Latency (ms)": "{:.1f}", "Agreement": "{:.3f}"},
+    )
 
+
+def mirror_file(src: Path, dst: Path) -> None:
+    # Hardlink instead of copying the bytes; fall back to a copy across filesystems.
+    if dst.exists():
+        if os.path.samefile(src, dst):
+            return
+        dst.unlink()
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def copy_figures_to_paper() -> None:
     existing = [
         RUN_DIR / "overall_accuracy.png",
         RUN_DIR / "mmlu" / "metrics.png",
@@ -380,52 +456,93 @@ def copy_figures_to_paper(figures: List[Path]) -> None:
                 renamed = f"{src.parent.name}_metrics.png"
             else:
                 renamed = src.name
-            shutil.copy2(src, PAPER_FIG_DIR / renamed)
-            shutil.copy2(src, DOC_FIG_DIR / renamed)
+            mirror_file(src, PAPER_FIG_DIR / renamed)
+            mirror_file(PAPER_FIG_DIR / renamed, DOC_FIG_DIR / renamed)
 
 
-def main() -> None:
-    prepare_dirs()
+def figure_cache_key(writer: Callable[..., Path], inputs: List[Path]) -> str:
+    # Input mtimes plus this script's own, so edits to the chart code also force a redraw.
+    parts = [str(path.stat().st_mtime_ns).encode() for path in (*inputs, Path(__file__))]
+    parts.append(writer.__qualname__.encode())
+    return hashlib.blake2b(b"|".join(parts), digest_size=16).hexdigest()
 
-    overall_rows = read_csv(RUN_DIR / "overall_summary.csv")
-    raw_rows = read_csv(RUN_DIR / "gsm8k" / "raw_records.csv")
-    significance_rows = read_csv(RUN_DIR / "overall_significance.csv")
 
-    metrics = build_matrices(overall_rows)
-    baseline_rows = read_csv(OPT_DIR / "gsm8k_baseline_summary.csv")
-    optimized_rows = read_csv(OPT_DIR / "gsm8k_optimized_summary.csv")
+def load_figure_cache() -> Dict[str, Dict[str, str]]:
+    try:
+        data = json.loads(FIGURE_CACHE_PATH.read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+    return data if isinstance(data, dict) else {}
 
-    generated = [
-        write_bar_chart_accuracy(metrics),
-        write_line_chart_latency(metrics),
-        write_pie_chart_avg_accuracy(metrics),
-        write_progress_chart(raw_rows),
-        write_optimization_chart(),
-    ]
 
-    baseline_map = {
-        row.get("strategy", "").lower(): {
-            "accuracy": as_float(row.get("accuracy"), 0.0),
-            "latency_mean_ms": as_float(row.get("latency_mean_ms"), 0.0),
-        }
-        for row in baseline_rows
-    }
-    optimized_map = {
-        row.get("strategy", "").lower(): {
-            "accuracy": as_float(row.get("accuracy"), 0.0),
-            "latency_mean_ms": as_float(row.get("latency_mean_ms"), 0.0),
+def cached_figure(entry: Any, key: str) -> Path | None:
+    if not isinstance(entry, dict) or entry.get("key") != key or not entry.get("output"):
+        return None
+    out = ROOT / entry["output"]
+    if out.is_file() and (PAPER_FIG_DIR / out.name).is_file():
+        return out
+    return None
+
+
+def main() -> None:
+    prepare_dirs()
+
+    raw_records_path = RUN_DIR / "gsm8k" / "raw_records.csv"
+    summary_path = RUN_DIR / "overall_summary.csv"
+    baseline_path = OPT_DIR / "gsm8k_baseline_summary.csv"
+    optimized_path = OPT_DIR / "gsm8k_optimized_summary.csv"
+
+    progress = gsm8k_progress(raw_records_path)
+    significance = pd.read_csv(RUN_DIR / "overall_significance.csv", dtype=str, keep_default_na=False)
+
+    metrics = build_matrices(summary_path)
+    means = strategy_means(metrics)
+    baseline = load_optimization_summary(baseline_path)
+    optimized = load_optimization_summary(optimized_path)
+
+    # Each chart is an independent Agg figure; render them in separate processes.
+    chart_jobs = [
+        (write_bar_chart_accuracy, (metrics,), [summary_path]),
+        (write_line_chart_latency, (metrics,), [summary_path]),
+        (write_pie_chart_avg_accuracy, (means,), [summary_path]),
+        (write_progress_chart, (progress,), [raw_records_path]),
+        (write_optimization_chart, (baseline, optimized), [baseline_path, optimized_path]),
+    ]
+    # Charts whose inputs are unchanged since the last run keep their existing PNGs.
+    cache = load_figure_cache()
+    keys = [figure_cache_key(fn, inputs) for fn, _, inputs in chart_jobs]
+    generated = [cached_figure(cache.get(fn.__qualname__), key) for (fn, _, _), key in zip(chart_jobs, keys)]
+    stale = [idx for idx, out in enumerate(generated) if out is None]
+    workers = min(len(stale), os.cpu_count() or 1)
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {idx: pool.submit(chart_jobs[idx][0], *chart_jobs[idx][1]) for idx in stale}
+            for idx, future in futures.items():
+                generated[idx] = future.result()
+    else:
+        for idx in stale:
+            fn, args, _ = chart_jobs[idx]
+            generated[idx] = fn(*args)
+    if stale:
+        cache = {
+            fn.__qualname__: {"key": key, "output": out.relative_to(ROOT).as_posix()}
+            for (fn, _, _), key, out in zip(chart_jobs, keys, generated)
         }
-        for row in optimized_rows
-    }
+        FIGURE_CACHE_PATH.write_text(json.dumps(cache, indent=2), encoding="utf-8")
+
     report = build_report_json(
         metrics,
-        raw_rows,
-        significance_rows,
-        optimization={"baseline": baseline_map, "optimized": optimized_map},
+        means,
+        progress,
+        significance,
+        optimization={
+            "baseline": baseline.to_dict(orient="index"),
+            "optimized": optimized.to_dict(orient="index"),
+        },
     )
     write_report_data(report)
-    write_paper_tables(metrics, significance_rows)
-    copy_figures_to_paper(generated)
+    write_paper_tables(metrics, means, significance)
+    copy_figures_to_paper()
 
     print("Generated visual assets and paper tables.")
     for path in generated: